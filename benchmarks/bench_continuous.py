@@ -0,0 +1,49 @@
+"""
+Measures convergence speed per fitness evaluation on the continuous benchmark functions,
+using SBX crossover and bounded polynomial mutation.
+
+Run from the repository root:
+    python benchmarks/bench_continuous.py
+"""
+import contextlib
+import io
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from genetic_algorithm_py import GeneticAlgorithm, DNA
+from genetic_algorithm_py.strategy import DNAStrategy
+
+PROBLEMS = [
+    ("SphereFitness", (-5.12, 5.12)),
+    ("RastriginFitness", (-5.12, 5.12)),
+    ("RosenbrockFitness", (-2.048, 2.048)),
+]
+
+def run_problem(fitness_name: str, bounds: tuple, dimensions: int = 10,
+                population_size: int = 100, generations: int = 200, seed: int = 0) -> list:
+    """Runs one problem and returns (evaluations, best fitness so far) after each generation."""
+    random.seed(seed)
+    dna = DNA(DNAStrategy(genes=None, bounds=bounds,
+                          selection_strategy="TournamentSelection",
+                          crossover_strategy="SimulatedBinaryCrossover",
+                          mutation_strategy="PolynomialMutation",
+                          fitness_strategy=fitness_name))
+    ga = GeneticAlgorithm(dna, population_size, dimensions, mutation_rate=1.0 / dimensions)
+    fitness_function = dna.get_fitness_function()
+    trace = []
+    # run_single_generation prints progress, which would drown the results
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(generations):
+            ga.run_single_generation()
+            trace.append((fitness_function.evaluation_count, ga.allBestIndividual.fitness))
+    return trace
+
+if __name__ == "__main__":
+    for fitness_name, bounds in PROBLEMS:
+        trace = run_problem(fitness_name, bounds)
+        checkpoints = [trace[i] for i in (9, 49, 99, len(trace) - 1)]
+        summary = ", ".join(f"{evaluations} evals: {fitness:.4g}" for evaluations, fitness in checkpoints)
+        print(f"{fitness_name}: {summary}")
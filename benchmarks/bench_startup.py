@@ -0,0 +1,44 @@
+"""
+Measures the startup cost of genetic_algorithm_py: the cold import time of the package
+and the time needed to construct DNAStrategy objects with default strategies.
+
+Run from the repository root:
+    python benchmarks/bench_startup.py
+"""
+import os
+import statistics
+import subprocess
+import sys
+import timeit
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SNIPPET = (
+    "import time; start = time.perf_counter(); import genetic_algorithm_py; "
+    "print(time.perf_counter() - start)"
+)
+
+def measure_import(repeats: int = 20) -> list:
+    """Times `import genetic_algorithm_py` in fresh interpreters, in seconds."""
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    timings = []
+    for _ in range(repeats):
+        output = subprocess.run([sys.executable, "-c", IMPORT_SNIPPET], env=env,
+                                capture_output=True, text=True, check=True).stdout
+        timings.append(float(output))
+    return timings
+
+def measure_construction(number: int = 10000) -> float:
+    """Returns the mean time to construct one DNAStrategy with default strategies, in seconds."""
+    sys.path.insert(0, REPO_ROOT)
+    from genetic_algorithm_py.strategy import DNAStrategy
+    # Warm up so the lazily imported default strategies are loaded
+    DNAStrategy(genes=[0, 1])
+    return timeit.timeit(lambda: DNAStrategy(genes=[0, 1]), number=number) / number
+
+if __name__ == "__main__":
+    import_timings = measure_import()
+    print(f"import genetic_algorithm_py: median {statistics.median(import_timings) * 1e3:.2f} ms, "
+          f"min {min(import_timings) * 1e3:.2f} ms over {len(import_timings)} runs")
+    construction = measure_construction()
+    print(f"DNAStrategy(): {construction * 1e6:.2f} us per instance")
@@ -1,3 +1,3 @@
-from .algorithm import GeneticAlgorithm, DNA, FitnessFunction, Selection, Crossover, Mutation
+from .algorithm import GeneticAlgorithm, DNA, FitnessFunction, SurrogateFitnessFunction, Selection, Crossover, Mutation
 from .individual import Individual
 from .population import Population
\ No newline at end of file
@@ -1,11 +1,20 @@
+import math
+import random
+from collections import deque
 # Import strategies and core classes for genetic algorithm components
 from .strategy.selection_strategy import SelectionStrategy
 from .strategy.mutation_strategy import MutationStrategy
 from .strategy.crossover_strategy import CrossoverStrategy
 from .strategy.fitness_strategy import FitnessStrategy
+from .strategy.surrogate_strategy import SurrogateStrategy
 from .strategy.dna_strategy import DNAStrategy
 from .population import Population
 from .individual import Individual
+from typing import TYPE_CHECKING
+
+# Import HistoryRecorder only for type hinting to keep the package import light
+if TYPE_CHECKING:
+    from .history import HistoryRecorder
 
 class DNA:
     """
@@ -21,11 +30,23 @@ class DNA:
         """
         return self.dna_strategy.generate_genome(genome_size)
 
-    def get_random_genes(self, genes_size: int = 1) -> list:
+    def get_random_genes(self, genes_size: int = 1, index: int = 0) -> list:
+        """
+        Retrieves random genes of the specified size, for the genome positions starting at index.
+        """
+        return self.dna_strategy.get_random_genes(genes_size, index)
+
+    def get_bounds(self, genome_size: int) -> list:
+        """
+        Retrieves the (low, high) bounds of each dimension, or None if genomes are not continuous.
+        """
+        return self.dna_strategy.get_bounds(genome_size)
+
+    def clip_genome(self, genome: list) -> list:
         """
-        Retrieves random genes of the specified size.
+        Returns a copy of the genome with every gene clipped into its bounds.
         """
-        return self.dna_strategy.get_random_genes(genes_size)
+        return self.dna_strategy.clip_genome(genome)
 
     def get_genes(self) -> list:
         return self.dna_strategy.genes
@@ -53,13 +74,151 @@ class FitnessFunction:
 
     def __init__(self, fitness_strategy: FitnessStrategy):
         self.fitness_strategy = fitness_strategy
+        # Number of genomes scored by the fitness strategy so far
+        self.evaluation_count = 0
 
     def evaluate(self, genome:list):
         """
         Evaluates the fitness of a given genome.
         """
+        self.evaluation_count += 1
         return self.fitness_strategy.evaluate(genome)
 
+    def evaluate_batch(self, genomes:list) -> list:
+        """
+        Evaluates the fitness of several genomes and returns their fitness values in order.
+        """
+        self.evaluation_count += len(genomes)
+        return self.fitness_strategy.evaluate_batch(genomes)
+
+    def evaluate_individuals(self, individuals:list) -> None:
+        """
+        Evaluates several individuals as one batch and assigns their fitness.
+        """
+        fitness_values = self.evaluate_batch([individual.genome for individual in individuals])
+        for individual, fitness in zip(individuals, fitness_values):
+            individual.fitness = fitness
+
+
+class SurrogateFitnessFunction(FitnessFunction):
+    """
+    Pre-screens batches of genomes with a cheap surrogate model so that only the most
+    promising fraction is scored by the real FitnessStrategy.
+
+    Individuals that receive a predicted fitness are flagged with `fitness_is_predicted`;
+    `Population.get_best_individual` confirms them with a real evaluation before reporting one as best.
+    """
+
+    def __init__(self, fitness_strategy: FitnessStrategy, surrogate_strategy: SurrogateStrategy):
+        super().__init__(fitness_strategy)
+        self.surrogate_strategy = surrogate_strategy
+        # Number of genomes given a predicted fitness and never evaluated for real
+        self.saved_evaluations = 0
+        self.num_samples = 0
+        self._concordant_pairs = 0
+        self._compared_pairs = 0
+        # Recent (predicted, real) fitness pairs of individuals confirmed after screening
+        self._confirmed = deque(maxlen=50)
+
+    def evaluate(self, genome:list):
+        """
+        Evaluates a genome with the real fitness function and trains the surrogate on it.
+        """
+        fitness = super().evaluate(genome)
+        self._train([genome], [fitness])
+        return fitness
+
+    def evaluate_batch(self, genomes:list) -> list:
+        """
+        Ranks the genomes with the surrogate, evaluates the best ranked fraction with the real
+        fitness function and assigns the predicted fitness to the rest.
+        """
+        fitness_values, _ = self._screen(genomes)
+        return fitness_values
+
+    def evaluate_individuals(self, individuals:list) -> None:
+        """
+        Screens several individuals as one batch, flagging those whose fitness is only predicted.
+        """
+        fitness_values, predicted = self._screen([individual.genome for individual in individuals])
+        for individual, fitness in zip(individuals, fitness_values):
+            individual.fitness = fitness
+        for index in predicted:
+            individuals[index].fitness_is_predicted = True
+
+    def confirm(self, individual) -> float:
+        """
+        Replaces the predicted fitness of an individual with a real evaluation.
+        """
+        if not individual.fitness_is_predicted:
+            individual.fitness = self.evaluate(individual.genome)
+            return individual.fitness
+        self.saved_evaluations -= 1
+        prediction = individual.fitness
+        individual.fitness = self.evaluate(individual.genome)
+        # Compare the confirmed prediction with the earlier ones, which are all of genomes the surrogate rejected
+        self._confirmed.append((prediction, individual.fitness))
+        self._record_ranking(*zip(*self._confirmed), first_new=len(self._confirmed) - 1)
+        return individual.fitness
+
+    def _screen(self, genomes:list) -> tuple[list, list]:
+        # Returns the fitness values and the indices of the genomes whose fitness is only predicted
+        if self.num_samples < self.surrogate_strategy.min_samples:
+            fitness_values = super().evaluate_batch(genomes)
+            self._train(genomes, fitness_values)
+            return fitness_values, []
+
+        predictions = self.surrogate_strategy.predict(genomes)
+        num_promising = min(len(genomes), max(1, math.ceil(len(genomes) * self.surrogate_strategy.evaluation_fraction)))
+        ranked = sorted(range(len(genomes)), key=predictions.__getitem__, reverse=True)
+        promising = ranked[:num_promising]
+        rejected = ranked[num_promising:]
+        # Audit a random sample of the rejected genomes so the ranking accuracy also covers the screening decision
+        num_audited = min(len(rejected), math.ceil(len(rejected) * self.surrogate_strategy.audit_fraction))
+        audited = random.sample(rejected, num_audited)
+
+        # Only the promising and audited genomes reach the real fitness function
+        evaluated = promising + audited
+        evaluated_genomes = [genomes[i] for i in evaluated]
+        true_values = super().evaluate_batch(evaluated_genomes)
+        self._record_ranking([predictions[i] for i in evaluated], true_values)
+        self._train(evaluated_genomes, true_values)
+        self.saved_evaluations += len(genomes) - len(evaluated)
+
+        fitness_values = list(predictions)
+        for index, fitness in zip(evaluated, true_values):
+            fitness_values[index] = fitness
+        audited = set(audited)
+        return fitness_values, [index for index in rejected if index not in audited]
+
+    @property
+    def ranking_accuracy(self):
+        """
+        Fraction of genome pairs the surrogate ranked in the same order as the real fitness
+        function, or None before any pair has been compared.
+
+        Pairs are taken from the genomes evaluated for real in each batch, which include a random
+        audit sample of the screened-out genomes, and from predictions confirmed by `confirm`.
+        """
+        if self._compared_pairs == 0:
+            return None
+        return self._concordant_pairs / self._compared_pairs
+
+    def _train(self, genomes:list, fitness_values:list) -> None:
+        self.surrogate_strategy.update(genomes, fitness_values)
+        self.num_samples += len(genomes)
+
+    def _record_ranking(self, predictions:list, true_values:list, first_new:int = 0) -> None:
+        # Count concordant pairs between predicted and real fitness, skipping real ties;
+        # only pairs that include a value at or after first_new are counted
+        for j in range(first_new, len(true_values)):
+            for i in range(j):
+                if true_values[i] == true_values[j]:
+                    continue
+                self._compared_pairs += 1
+                if (predictions[i] - predictions[j]) * (true_values[i] - true_values[j]) > 0:
+                    self._concordant_pairs += 1
+
 
 class Selection:
     """
@@ -75,6 +234,12 @@ class Selection:
         """
         return self.selection_strategy.select_parents(population)
 
+    def select_parent_indices(self, population: Population, num_pairs: int) -> list[tuple[int, int]]:
+        """
+        Selects parent pairs for a whole generation as indices into the population.
+        """
+        return self.selection_strategy.select_parent_indices(population, num_pairs)
+
 
 class Crossover:
     """
@@ -101,9 +266,18 @@ class Mutation:
 
     def mutate(self, individual: Individual):
         """
-        Mutates the given individual.
+        Mutates the given individual and invalidates its fitness if the genome changed.
         """
-        return self.mutation_strategy.mutate(individual)
+        # Already dirty individuals need no check; otherwise compare against a snapshot
+        original_genome = None if individual.is_dirty else list(individual.genome)
+        mutated = self.mutation_strategy.mutate(individual)
+        # Keep continuous genomes inside their bounds whatever the strategy did
+        genome = individual.genome
+        if individual.dna.get_bounds(len(genome)) is not None:
+            genome[:] = individual.dna.clip_genome(genome)
+        if original_genome is not None and list(individual.genome) != original_genome:
+            individual.invalidate_fitness()
+        return mutated
 
     def set_mutation_rate(self, mutation_rate: float):
         """
@@ -117,9 +291,12 @@ class GeneticAlgorithm:
     Executes the genetic algorithm using DNA, population, selection, crossover, and mutation strategies.
     """
 
-    def __init__(self, dna: DNA, population_size: int, genome_size: int, mutation_rate: float):
+    def __init__(self, dna: DNA, population_size: int, genome_size: int, mutation_rate: float,
+                 history: 'HistoryRecorder' = None):
         # Initialize components and parameters
         self.dna = dna
+        # Optional recorder that archives every generation with its parent indices
+        self.history = history
         self.mutation_rate = mutation_rate
         self.dna.get_mutation().set_mutation_rate(mutation_rate)
         self.currentGen = 0
@@ -130,8 +307,6 @@ class GeneticAlgorithm:
         """
         Runs the genetic algorithm across the specified number of generations.
         """
-        # Evaluate initial population
-        self.population.evaluate_population()
         for i in range(generations):
             best_individual = self.run_single_generation()
         return best_individual
@@ -142,12 +317,18 @@ class GeneticAlgorithm:
         """
         # Generate new offspring for the population
         new_population = []
-        # Evaluate the new population if it's the first generation
-        if self.currentGen == 0:
-            self.population.evaluate_population()
-        while len(new_population) < len(self.population.individuals):
-            # Select parents for crossover
-            parent1, parent2 = self.dna.get_selection().select_parents(self.population)
+        # Evaluate any individuals not yet scored before selection needs their fitness
+        self.population.evaluate_population()
+        # Record the initial population before it is replaced
+        if self.history is not None and self.currentGen == 0:
+            self.history.record(self.population)
+        individuals = self.population.individuals
+        offspring_parents = []
+        # Select the parents of every offspring pair in one batch
+        num_pairs = (len(individuals) + 1) // 2
+        parent_indices = self.dna.get_selection().select_parent_indices(self.population, num_pairs)
+        for index1, index2 in parent_indices:
+            parent1, parent2 = individuals[index1], individuals[index2]
 
             # Apply crossover to generate offspring
             offspring1, offspring2 = self.dna.get_crossover().crossover(parent1, parent2)
@@ -158,6 +339,7 @@ class GeneticAlgorithm:
 
             # Add offspring to the new population
             new_population.extend([offspring1, offspring2])
+            offspring_parents.extend([(index1, index2), (index1, index2)])
 
         # Replace the old population with the new generation
         self.population.individuals = new_population[:len(self.population.individuals)]
@@ -167,6 +349,9 @@ class GeneticAlgorithm:
 
         # Track the best individual in the current generation
         best_individual = self.population.get_best_individual()
+        # Record after the best individual is known, so a confirmed surrogate prediction is archived as measured
+        if self.history is not None:
+            self.history.record(self.population, offspring_parents[:len(self.population.individuals)])
         if self.allBestIndividual is None:
             self.allBestIndividual = best_individual
         elif best_individual.fitness > self.allBestIndividual.fitness:
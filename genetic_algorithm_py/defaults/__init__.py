@@ -1,4 +1,54 @@
-from .fitness_function import MaximizeOnesFitness, MinimizeDistanceFitness, WeightedSumFitness, CompairTargetFitness
-from .selection import RouletteWheelSelection, TournamentSelection, StochasticUniversalSampling, RankSelection, ElitismSelection, TruncationSelection, RankBiasedSelection, BoltzmannSelection, SteadyStateSelection
-from .crossover import OnePointCrossover, UniformCrossover, HalfCrossover, TwoPointCrossover, BlendCrossover, ArithmeticCrossover, PMXCrossover
-from .mutation import SwapMutation, GaussianMutation, PolynomialMutation, ElementMutation, MultiElementMutation, BitFlipMutation, ScrambleMutation, SegmentSwapMutation, BoundaryMutation
\ No newline at end of file
+import importlib
+
+# Submodule defining each default strategy. Strategies are imported on first access,
+# so importing the package only loads the modules that are actually used.
+_STRATEGY_MODULES = {
+    'MaximizeOnesFitness': 'fitness_function',
+    'MinimizeDistanceFitness': 'fitness_function',
+    'WeightedSumFitness': 'fitness_function',
+    'CompairTargetFitness': 'fitness_function',
+    'SphereFitness': 'fitness_function',
+    'RastriginFitness': 'fitness_function',
+    'RosenbrockFitness': 'fitness_function',
+    'RouletteWheelSelection': 'selection',
+    'TournamentSelection': 'selection',
+    'StochasticUniversalSampling': 'selection',
+    'RankSelection': 'selection',
+    'ElitismSelection': 'selection',
+    'TruncationSelection': 'selection',
+    'RankBiasedSelection': 'selection',
+    'BoltzmannSelection': 'selection',
+    'SteadyStateSelection': 'selection',
+    'OnePointCrossover': 'crossover',
+    'UniformCrossover': 'crossover',
+    'HalfCrossover': 'crossover',
+    'TwoPointCrossover': 'crossover',
+    'BlendCrossover': 'crossover',
+    'ArithmeticCrossover': 'crossover',
+    'PMXCrossover': 'crossover',
+    'SimulatedBinaryCrossover': 'crossover',
+    'SwapMutation': 'mutation',
+    'GaussianMutation': 'mutation',
+    'PolynomialMutation': 'mutation',
+    'ElementMutation': 'mutation',
+    'MultiElementMutation': 'mutation',
+    'BitFlipMutation': 'mutation',
+    'ScrambleMutation': 'mutation',
+    'SegmentSwapMutation': 'mutation',
+    'BoundaryMutation': 'mutation',
+    'KNNSurrogate': 'surrogate',
+}
+
+__all__ = list(_STRATEGY_MODULES)
+
+def __getattr__(name):
+    module_name = _STRATEGY_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    strategy = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache the strategy so later lookups skip __getattr__
+    globals()[name] = strategy
+    return strategy
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,6 @@
 from ..strategy.crossover_strategy import CrossoverStrategy
 from ..individual import Individual
+import math
 import random
 
 class HalfCrossover(CrossoverStrategy):
@@ -11,10 +12,8 @@ class HalfCrossover(CrossoverStrategy):
         offspring1_genome = parent1.genome[:crossover_point] + parent2.genome[crossover_point:]
         offspring2_genome = parent2.genome[:crossover_point] + parent1.genome[crossover_point:]
         
-        offspring1 = Individual(parent1.dna, len(parent1.genome))
-        offspring1.genome = offspring1_genome
-        offspring2 = Individual(parent1.dna, len(parent2.genome))
-        offspring2.genome = offspring2_genome
+        offspring1 = Individual(parent1.dna, len(parent1.genome), offspring1_genome)
+        offspring2 = Individual(parent1.dna, len(parent2.genome), offspring2_genome)
         
         return offspring1, offspring2
 
@@ -27,10 +26,8 @@ class OnePointCrossover(CrossoverStrategy):
         offspring1_genome = parent1.genome[:crossover_point] + parent2.genome[crossover_point:]
         offspring2_genome = parent2.genome[:crossover_point] + parent1.genome[crossover_point:]
         
-        offspring1 = Individual(parent1.dna, len(parent1.genome))
-        offspring1.genome = offspring1_genome
-        offspring2 = Individual(parent1.dna, len(parent2.genome))
-        offspring2.genome = offspring2_genome
+        offspring1 = Individual(parent1.dna, len(parent1.genome), offspring1_genome)
+        offspring2 = Individual(parent1.dna, len(parent2.genome), offspring2_genome)
         
         return offspring1, offspring2
 
@@ -45,10 +42,8 @@ class TwoPointCrossover(CrossoverStrategy):
         offspring1_genome = parent1.genome[:point1] + parent2.genome[point1:point2] + parent1.genome[point2:]
         offspring2_genome = parent2.genome[:point1] + parent1.genome[point1:point2] + parent2.genome[point2:]
         
-        offspring1 = Individual(parent1.dna, len(parent1.genome))
-        offspring1.genome = offspring1_genome
-        offspring2 = Individual(parent2.dna, len(parent2.genome))
-        offspring2.genome = offspring2_genome
+        offspring1 = Individual(parent1.dna, len(parent1.genome), offspring1_genome)
+        offspring2 = Individual(parent2.dna, len(parent2.genome), offspring2_genome)
         
         return offspring1, offspring2
 
@@ -60,10 +55,8 @@ class UniformCrossover(CrossoverStrategy):
         offspring1_genome = [random.choice([gene1, gene2]) for gene1, gene2 in zip(parent1.genome, parent2.genome)]
         offspring2_genome = [random.choice([gene1, gene2]) for gene1, gene2 in zip(parent2.genome, parent1.genome)]
         
-        offspring1 = Individual(parent1.dna, len(parent1.genome))
-        offspring1.genome = offspring1_genome
-        offspring2 = Individual(parent2.dna, len(parent2.genome))
-        offspring2.genome = offspring2_genome
+        offspring1 = Individual(parent1.dna, len(parent1.genome), offspring1_genome)
+        offspring2 = Individual(parent2.dna, len(parent2.genome), offspring2_genome)
         
         return offspring1, offspring2
 
@@ -84,11 +77,14 @@ class BlendCrossover(CrossoverStrategy):
             diff = upper - lower
             offspring1_genome.append(random.uniform(lower - self.alpha * diff, upper + self.alpha * diff))
             offspring2_genome.append(random.uniform(lower - self.alpha * diff, upper + self.alpha * diff))
+
+        # Keep the extended range inside the bounds of continuous genomes
+        if parent1.dna.get_bounds(len(parent1.genome)) is not None:
+            offspring1_genome = parent1.dna.clip_genome(offspring1_genome)
+            offspring2_genome = parent1.dna.clip_genome(offspring2_genome)
         
-        offspring1 = Individual(parent1.dna, len(parent1.genome))
-        offspring1.genome = offspring1_genome
-        offspring2 = Individual(parent2.dna, len(parent2.genome))
-        offspring2.genome = offspring2_genome
+        offspring1 = Individual(parent1.dna, len(parent1.genome), offspring1_genome)
+        offspring2 = Individual(parent2.dna, len(parent2.genome), offspring2_genome)
         
         return offspring1, offspring2
 
@@ -103,10 +99,8 @@ class ArithmeticCrossover(CrossoverStrategy):
         offspring1_genome = [(self.alpha * gene1 + (1 - self.alpha) * gene2) for gene1, gene2 in zip(parent1.genome, parent2.genome)]
         offspring2_genome = [(self.alpha * gene2 + (1 - self.alpha) * gene1) for gene1, gene2 in zip(parent1.genome, parent2.genome)]
         
-        offspring1 = Individual(parent1.dna, len(parent1.genome))
-        offspring1.genome = offspring1_genome
-        offspring2 = Individual(parent2.dna, len(parent2.genome))
-        offspring2.genome = offspring2_genome
+        offspring1 = Individual(parent1.dna, len(parent1.genome), offspring1_genome)
+        offspring2 = Individual(parent2.dna, len(parent2.genome), offspring2_genome)
         
         return offspring1, offspring2
 
@@ -126,9 +120,58 @@ class PMXCrossover(CrossoverStrategy):
         offspring1_genome[point1:point2] = parent2.genome[point1:point2]
         offspring2_genome[point1:point2] = parent1.genome[point1:point2]
 
-        offspring1 = Individual(parent1.dna, len(parent1.genome))
-        offspring1.genome = offspring1_genome
-        offspring2 = Individual(parent2.dna, len(parent2.genome))
-        offspring2.genome = offspring2_genome
+        offspring1 = Individual(parent1.dna, len(parent1.genome), offspring1_genome)
+        offspring2 = Individual(parent2.dna, len(parent2.genome), offspring2_genome)
         
         return offspring1, offspring2
+
+class SimulatedBinaryCrossover(CrossoverStrategy):
+    def __init__(self, eta=15.0, crossover_rate=0.5):
+        # Distribution index: larger values keep offspring closer to their parents
+        self.eta = eta
+        # Probability that each pair of genes is recombined
+        self.crossover_rate = crossover_rate
+
+    def crossover(self, parent1: Individual, parent2: Individual) -> tuple[Individual, Individual]:
+        """
+        Performs simulated binary crossover (SBX) on real-valued genomes, respecting the DNA bounds if any.
+        """
+        size = len(parent1.genome)
+        bounds = parent1.dna.get_bounds(size) or [(-math.inf, math.inf)] * size
+        exponent = 1.0 / (self.eta + 1.0)
+
+        offspring1_genome = list(parent1.genome)
+        offspring2_genome = list(parent2.genome)
+
+        for i, (gene1, gene2) in enumerate(zip(parent1.genome, parent2.genome)):
+            low, high = bounds[i]
+            # Clip the parent genes first so the spread factors below stay well defined
+            gene1 = min(max(gene1, low), high)
+            gene2 = min(max(gene2, low), high)
+            offspring1_genome[i], offspring2_genome[i] = gene1, gene2
+            if random.random() >= self.crossover_rate or abs(gene1 - gene2) < 1e-14:
+                continue
+            lower, upper = min(gene1, gene2), max(gene1, gene2)
+            diff = upper - lower
+            # Spread factors are drawn so that the children cannot leave the bounds
+            rand = random.random()
+            child1 = 0.5 * (lower + upper - self._spread(rand, 1.0 + 2.0 * (lower - low) / diff, exponent) * diff)
+            child2 = 0.5 * (lower + upper + self._spread(rand, 1.0 + 2.0 * (high - upper) / diff, exponent) * diff)
+            child1 = min(max(child1, low), high)
+            child2 = min(max(child2, low), high)
+            if random.random() < 0.5:
+                child1, child2 = child2, child1
+            offspring1_genome[i] = child1
+            offspring2_genome[i] = child2
+
+        offspring1 = Individual(parent1.dna, size, offspring1_genome)
+        offspring2 = Individual(parent2.dna, size, offspring2_genome)
+
+        return offspring1, offspring2
+
+    def _spread(self, rand, beta, exponent):
+        # Inverse of the SBX spread distribution truncated at the bound distance beta
+        alpha = 2.0 - beta ** -(self.eta + 1.0)
+        if rand <= 1.0 / alpha:
+            return (rand * alpha) ** exponent
+        return (1.0 / (2.0 - rand * alpha)) ** exponent
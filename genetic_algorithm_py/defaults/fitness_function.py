@@ -1,3 +1,4 @@
+import math
 from ..strategy.fitness_strategy import FitnessStrategy
 
 class CompairTargetFitness(FitnessStrategy):
@@ -42,3 +43,39 @@ class WeightedSumFitness(FitnessStrategy):
     def evaluate(self, genome):
         """Calculates fitness as the weighted sum of genome bits."""
         return sum(g * w for g, w in zip(genome, self.weights))
+
+
+class SphereFitness(FitnessStrategy):
+    def evaluate(self, genome):
+        """Calculates fitness as the negative sphere function (sum of squares); the optimum 0 is at the origin."""
+        return -sum(x * x for x in genome)
+
+    def evaluate_batch(self, genomes):
+        """Evaluates the sphere function for a batch of genomes."""
+        return [-sum(x * x for x in genome) for genome in genomes]
+
+
+class RastriginFitness(FitnessStrategy):
+    def __init__(self, a=10.0):
+        super().__init__()
+        self.a = a
+
+    def evaluate(self, genome):
+        """Calculates fitness as the negative Rastrigin function; the optimum 0 is at the origin."""
+        return self.evaluate_batch([genome])[0]
+
+    def evaluate_batch(self, genomes):
+        """Evaluates the Rastrigin function for a batch of genomes."""
+        a, cos, two_pi = self.a, math.cos, 2 * math.pi
+        return [-(a * len(genome) + sum(x * x - a * cos(two_pi * x) for x in genome)) for genome in genomes]
+
+
+class RosenbrockFitness(FitnessStrategy):
+    def evaluate(self, genome):
+        """Calculates fitness as the negative Rosenbrock function; the optimum 0 is at (1, ..., 1)."""
+        return self.evaluate_batch([genome])[0]
+
+    def evaluate_batch(self, genomes):
+        """Evaluates the Rosenbrock function for a batch of genomes."""
+        return [-sum(100 * (x2 - x1 * x1) ** 2 + (1 - x1) ** 2 for x1, x2 in zip(genome, genome[1:]))
+                for genome in genomes]
@@ -8,7 +8,7 @@ class MultiElementMutation(MutationStrategy):
         genome = individual.genome
         for i in range(len(genome)):
             if random.random() < self.mutation_rate:
-                genome[i] = individual.dna.get_random_genes()[0]  # Flip the bit
+                genome[i] = individual.dna.get_random_genes(1, i)[0]  # Flip the bit
         return individual
 
 class ElementMutation(MutationStrategy):
@@ -17,7 +17,7 @@ class ElementMutation(MutationStrategy):
         genome = individual.genome
         if random.random() < self.mutation_rate:
             i = random.randint(0, len(genome) - 1)
-            genome[i] = individual.dna.get_random_genes()[0]  # Flip the bit
+            genome[i] = individual.dna.get_random_genes(1, i)[0]  # Flip the bit
         return individual
 
 class BitFlipMutation(MutationStrategy):
@@ -45,7 +45,7 @@ class ScrambleMutation(MutationStrategy):
         genome = individual.genome
         if random.random() < self.mutation_rate:
             start, end = sorted(random.sample(range(len(genome)), 2))
-            subset = individual.dna.get_random_genes(end - start)
+            subset = individual.dna.get_random_genes(end - start, start)
             random.shuffle(subset)
             genome[start:end] = subset
         return individual
@@ -70,14 +70,23 @@ class GaussianMutation(MutationStrategy):
     def mutate(self, individual):
         """Applies Gaussian mutation to the individual's genome."""
         genome = individual.genome
+        bounds = individual.dna.get_bounds(len(genome))
         for i in range(len(genome)):
             if random.random() < self.mutation_rate:
-                genome[i] += random.gauss(0, self.sigma)  # Apply Gaussian mutation
+                gene = genome[i] + random.gauss(0, self.sigma)  # Apply Gaussian mutation
+                if bounds is not None:
+                    # Clip the gene into its bounds in continuous mode
+                    gene = min(max(gene, bounds[i][0]), bounds[i][1])
+                genome[i] = gene
         return individual
 
 class BoundaryMutation(MutationStrategy):
-    def __init__(self, mutation_rate=0.01, min_value=-1.0, max_value=1.0):
-        """Initializes boundary mutation with specified mutation rate and boundaries."""
+    def __init__(self, mutation_rate=0.01, min_value=None, max_value=None):
+        """Initializes boundary mutation with specified mutation rate and boundaries.
+
+        Without explicit boundaries, each gene uses the bounds of its dimension in the DNA,
+        or [-1, 1] when the DNA has no bounds.
+        """
         super().__init__(mutation_rate)
         self.min_value = min_value
         self.max_value = max_value
@@ -85,10 +94,13 @@ class BoundaryMutation(MutationStrategy):
     def mutate(self, individual):
         """Mutates an individual's genome within the specified boundaries."""
         genome = individual.genome
+        bounds = individual.dna.get_bounds(len(genome)) or [(-1.0, 1.0)] * len(genome)
         for i in range(len(genome)):
             if random.random() < self.mutation_rate:
+                low = bounds[i][0] if self.min_value is None else self.min_value
+                high = bounds[i][1] if self.max_value is None else self.max_value
                 # Mutate the gene within the specified boundary
-                genome[i] = random.uniform(self.min_value, self.max_value)
+                genome[i] = random.uniform(low, high)
         return individual
 
 class PolynomialMutation(MutationStrategy):
@@ -98,13 +110,24 @@ class PolynomialMutation(MutationStrategy):
         self.eta = eta  # Distribution index for the polynomial mutation
 
     def mutate(self, individual):
-        """Applies polynomial mutation to the individual's genome."""
+        """Applies bounded polynomial mutation to the individual's genome, using [0, 1] when the DNA has no bounds."""
         genome = individual.genome
+        bounds = individual.dna.get_bounds(len(genome)) or [(0.0, 1.0)] * len(genome)
+        exponent = 1.0 / (self.eta + 1.0)
         for i in range(len(genome)):
             if random.random() < self.mutation_rate:
+                low, high = bounds[i]
+                span = high - low
+                gene = min(max(genome[i], low), high)
                 delta = random.random()  # Random value between 0 and 1
+                # Perturbation shrinks near a bound so the gene stays inside it
                 if delta < 0.5:
-                    genome[i] += (1 - genome[i]) * (delta ** (self.eta))
+                    distance = 1 - (gene - low) / span
+                    value = 2 * delta + (1 - 2 * delta) * distance ** (self.eta + 1)
+                    shift = value ** exponent - 1
                 else:
-                    genome[i] -= genome[i] * ((1 - delta) ** (self.eta))
+                    distance = 1 - (high - gene) / span
+                    value = 2 * (1 - delta) + 2 * (delta - 0.5) * distance ** (self.eta + 1)
+                    shift = 1 - value ** exponent
+                genome[i] = min(max(gene + shift * span, low), high)
         return individual
@@ -1,14 +1,28 @@
 import random
 import math
+from bisect import bisect_left
+from itertools import accumulate
 from ..strategy.selection_strategy import SelectionStrategy
 from ..individual import Individual
 from ..population import Population
 
+def _proportional_weights(population: Population) -> list:
+    # Fitness-proportional weights must be non-negative: shift negative fitness values
+    # (e.g. the negated benchmark functions) so that the worst individual gets weight zero
+    fitness_values = [individual.fitness for individual in population.individuals]
+    lowest = min(fitness_values)
+    if lowest < 0:
+        fitness_values = [fitness - lowest for fitness in fitness_values]
+    if sum(fitness_values) <= 0:
+        # Every individual is equally (un)fit, so select uniformly
+        return [1.0] * len(fitness_values)
+    return fitness_values
+
 # Roulette Wheel Selection
 class RouletteWheelSelection(SelectionStrategy):
     def select_parents(self, population: Population) -> tuple[Individual, Individual]:
         # Get fitness values of all individuals in the population
-        fitness_values = [individual.fitness for individual in population.individuals]
+        fitness_values = _proportional_weights(population)
         total_fitness = sum(fitness_values)
         # Calculate selection probabilities based on fitness
         selection_probs = [fitness / total_fitness for fitness in fitness_values]
@@ -22,10 +36,17 @@ class TournamentSelection(SelectionStrategy):
         self.tournament_size = tournament_size
 
     def select_parents(self, population):
-        # Select a random sample of individuals for the tournament
-        tournament = random.sample(population.individuals, self.tournament_size)
-        # Select the individual with the highest fitness as the parent
-        return max(tournament, key=lambda ind: ind.fitness)
+        # Run two tournaments and return their winners as the parents
+        (index1, index2), = self.select_parent_indices(population, 1)
+        return population.individuals[index1], population.individuals[index2]
+
+    def select_parent_indices(self, population, num_pairs):
+        fitness_values = [ind.fitness for ind in population.individuals]
+        indices = range(len(fitness_values))
+        # Each tournament draws distinct contestants; the winner is the fittest of them
+        winners = [max(random.sample(indices, self.tournament_size), key=fitness_values.__getitem__)
+                   for _ in range(2 * num_pairs)]
+        return list(zip(winners[0::2], winners[1::2]))
 
 # Rank Selection
 class RankSelection(SelectionStrategy):
@@ -41,25 +62,31 @@ class RankSelection(SelectionStrategy):
 # Stochastic Universal Sampling (SUS)
 class StochasticUniversalSampling(SelectionStrategy):
     def __init__(self, num_select=2):
-        # Initialize number of parents to select
+        # Initialize number of evenly spaced pointers used by select_parents
         self.num_select = num_select
 
     def select_parents(self, population):
-        # Calculate total fitness and point distance between selections
-        total_fitness = sum(ind.fitness for ind in population.individuals)
-        point_distance = total_fitness / self.num_select
+        # Select individuals at evenly spaced pointers over the fitness distribution and pair two of them
+        indices = self._spin(population, max(self.num_select, 2))
+        index1, index2 = random.sample(indices, 2)
+        return population.individuals[index1], population.individuals[index2]
+
+    def select_parent_indices(self, population, num_pairs):
+        # Spin the wheel once with a pointer for every parent of the generation
+        indices = self._spin(population, 2 * num_pairs)
+        # Pointers come out in population order, so shuffle before pairing them up
+        random.shuffle(indices)
+        return list(zip(indices[0::2], indices[1::2]))
+
+    def _spin(self, population, num_select):
+        # Build the cumulative fitness distribution in a single pass
+        cumulative = list(accumulate(_proportional_weights(population)))
+        point_distance = cumulative[-1] / num_select
         start_point = random.uniform(0, point_distance)
-        pointers = [start_point + i * point_distance for i in range(self.num_select)]
-        selected = []
-        for point in pointers:
-            cumulative = 0
-            # Select individuals based on fitness distribution
-            for ind in population.individuals:
-                cumulative += ind.fitness
-                if cumulative >= point:
-                    selected.append(ind)
-                    break
-        return selected
+        last_index = len(cumulative) - 1
+        # Locate the individual under each pointer with a binary search
+        return [min(bisect_left(cumulative, start_point + i * point_distance), last_index)
+                for i in range(num_select)]
 
 # Elitism Selection
 class ElitismSelection(SelectionStrategy):
@@ -80,12 +107,19 @@ class TruncationSelection(SelectionStrategy):
         self.percentage = percentage
 
     def select_parents(self, population):
-        # Sort population by fitness in descending order
-        sorted_population = sorted(population.individuals, key=lambda ind: ind.fitness, reverse=True)
-        # Calculate number of individuals to select based on percentage
-        num_to_select = int(len(population.individuals) * self.percentage)
-        # Return the top individuals based on truncation percentage
-        return sorted_population[:num_to_select]
+        # Pick two parents uniformly from the truncated top individuals
+        (index1, index2), = self.select_parent_indices(population, 1)
+        return population.individuals[index1], population.individuals[index2]
+
+    def select_parent_indices(self, population, num_pairs):
+        individuals = population.individuals
+        # Calculate number of individuals to keep based on percentage, keeping at least one
+        num_to_select = max(int(len(individuals) * self.percentage), 1)
+        # Sort indices by fitness in descending order and truncate
+        top_indices = sorted(range(len(individuals)), key=lambda i: individuals[i].fitness, reverse=True)[:num_to_select]
+        # Draw every parent of the generation from the truncated indices at once
+        parents = random.choices(top_indices, k=2 * num_pairs)
+        return list(zip(parents[0::2], parents[1::2]))
 
 # Boltzmann Selection
 class BoltzmannSelection(SelectionStrategy):
@@ -0,0 +1,45 @@
+import heapq
+from collections import deque
+from ..strategy.surrogate_strategy import SurrogateStrategy
+
+def _genome_distance(genome1: list, genome2: list) -> float:
+    """Squared Euclidean distance between genomes, counting 1 for each mismatched non-numeric gene."""
+    try:
+        return sum((gene1 - gene2) ** 2 for gene1, gene2 in zip(genome1, genome2))
+    except TypeError:
+        distance = 0
+        for gene1, gene2 in zip(genome1, genome2):
+            if gene1 != gene2:
+                try:
+                    distance += (gene1 - gene2) ** 2
+                except TypeError:
+                    distance += 1
+        return distance
+
+class KNNSurrogate(SurrogateStrategy):
+    def __init__(self, k=5, evaluation_fraction=0.25, min_samples=20, max_samples=500, audit_fraction=0.05):
+        """Initializes a k-nearest-neighbour surrogate over an archive of evaluated genomes.
+
+        Each prediction compares the genome with every archived sample, so predicting a batch
+        costs O(batch size * max_samples * genome size); raise max_samples only when the real
+        fitness function is much more expensive than that.
+        """
+        super().__init__(evaluation_fraction, min_samples, audit_fraction)
+        if max_samples < min_samples:
+            raise ValueError("Error: max_samples must be at least min_samples.")
+        self.k = k
+        # Keep only the most recent samples so prediction cost stays bounded
+        self.archive = deque(maxlen=max_samples)
+
+    def update(self, genomes, fitness_values):
+        """Adds evaluated genomes and their real fitness to the archive."""
+        for genome, fitness in zip(genomes, fitness_values):
+            self.archive.append((list(genome), fitness))
+
+    def predict(self, genomes):
+        """Predicts fitness as the mean fitness of the k nearest archived genomes."""
+        predictions = []
+        for genome in genomes:
+            nearest = heapq.nsmallest(self.k, self.archive, key=lambda sample: _genome_distance(genome, sample[0]))
+            predictions.append(sum(fitness for _, fitness in nearest) / len(nearest))
+        return predictions
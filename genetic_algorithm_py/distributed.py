@@ -0,0 +1,384 @@
+"""
+Distributed fitness evaluation over TCP or Unix sockets.
+
+Workers (`EvaluationWorker`) hold a DNAStrategy and evaluate batches of genomes with its
+fitness function. The master side is a FitnessStrategy (`DistributedFitness`) that splits
+each population evaluation into batches and fans them out over persistent connections.
+
+Addresses are `(host, port)` tuples for TCP or filesystem paths for Unix sockets. A worker
+can be started from the command line with a JSON DNAStrategy spec whose strategies are
+given by registered name:
+
+    python -m genetic_algorithm_py.distributed --listen 127.0.0.1:5000 \
+        --spec '{"genes": null, "bounds": [-5.12, 5.12], "fitness_strategy": "RastriginFitness"}'
+
+Every frame is a fixed header (message type, batch id, payload length) followed by the
+payload. Genome batches of ints or floats are sent as packed little-endian arrays, other
+gene types fall back to JSON. Fitness values are returned as packed doubles.
+"""
+import argparse
+import importlib
+import json
+import os
+import queue
+import socket
+import struct
+import sys
+import threading
+from array import array
+from collections import deque
+from .strategy.fitness_strategy import FitnessStrategy
+from .strategy.dna_strategy import DNAStrategy
+
+# Message types
+EVALUATE = 1
+RESULT = 2
+ERROR = 3
+
+# Message type, batch id, payload length
+_FRAME_HEADER = struct.Struct('!BII')
+# Gene typecode, number of genomes, genome size
+_BATCH_HEADER = struct.Struct('!cII')
+
+
+class WorkerError(RuntimeError):
+    """Raised on the master when a worker failed to evaluate a batch."""
+
+
+def _create_socket(address) -> socket.socket:
+    family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+    return socket.socket(family, socket.SOCK_STREAM)
+
+
+def parse_address(text: str):
+    """Parses 'host:port' into a TCP address or 'unix:/path' into a Unix socket path."""
+    if text.startswith('unix:'):
+        return text[len('unix:'):]
+    host, _, port = text.rpartition(':')
+    return host, int(port)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if count == 0:
+            raise ConnectionError("Error: Connection closed by peer.")
+        received += count
+    return bytes(buffer)
+
+
+def _send_frame(sock: socket.socket, message_type: int, batch_id: int, payload: bytes) -> None:
+    sock.sendall(_FRAME_HEADER.pack(message_type, batch_id, len(payload)) + payload)
+
+
+def _recv_frame(sock: socket.socket) -> tuple:
+    message_type, batch_id, length = _FRAME_HEADER.unpack(_recv_exact(sock, _FRAME_HEADER.size))
+    return message_type, batch_id, _recv_exact(sock, length)
+
+
+def _pack_array(values: array) -> bytes:
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpack_array(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def encode_genomes(genomes: list) -> bytes:
+    """Encodes a batch of genomes, packing them as a flat array when every gene is an int or a float."""
+    genome_size = len(genomes[0]) if genomes else 0
+    if all(len(genome) == genome_size for genome in genomes):
+        genes = [gene for genome in genomes for gene in genome]
+        if all(type(gene) in (int, bool) for gene in genes):
+            typecode = 'q'
+        elif all(type(gene) in (int, bool, float) for gene in genes):
+            typecode = 'd'
+        else:
+            typecode = None
+        if typecode is not None:
+            try:
+                packed = _pack_array(array(typecode, genes))
+            except OverflowError:
+                pass
+            else:
+                return _BATCH_HEADER.pack(typecode.encode(), len(genomes), genome_size) + packed
+    return _BATCH_HEADER.pack(b'j', len(genomes), genome_size) + json.dumps(genomes).encode()
+
+
+def decode_genomes(payload: bytes) -> list:
+    """Decodes a batch of genomes encoded by `encode_genomes`."""
+    typecode, count, genome_size = _BATCH_HEADER.unpack_from(payload)
+    body = payload[_BATCH_HEADER.size:]
+    if typecode == b'j':
+        return json.loads(body)
+    genes = _unpack_array(typecode.decode(), body).tolist()
+    return [genes[i * genome_size:(i + 1) * genome_size] for i in range(count)]
+
+
+class EvaluationWorker:
+    """
+    Serves fitness evaluations for the fitness function of a DNAStrategy.
+    """
+
+    def __init__(self, address, dna_strategy, backlog: int = 16):
+        """
+        Binds the listening socket immediately, so `address` holds the actual port when port 0 is given.
+
+        Parameters:
+            address: A (host, port) tuple for TCP or a filesystem path for a Unix socket.
+            dna_strategy: A DNAStrategy, or a dict of DNAStrategy keyword arguments in which
+                strategies are given by registered name.
+        """
+        if isinstance(dna_strategy, dict):
+            dna_strategy = DNAStrategy(**dna_strategy)
+        self.fitness_function = dna_strategy.fitness_function
+        self._server = _create_socket(address)
+        if isinstance(address, str):
+            if os.path.exists(address):
+                os.unlink(address)
+        else:
+            self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(address)
+        self._server.listen(backlog)
+        self.address = self._server.getsockname()
+        self._running = True
+        self._connections = set()
+        self._lock = threading.Lock()
+
+    def serve_forever(self) -> None:
+        """
+        Accepts connections until `shutdown` is called, serving each connection on its own thread.
+        """
+        while self._running:
+            try:
+                connection, _ = self._server.accept()
+            except OSError:
+                break
+            threading.Thread(target=self._serve_connection, args=(connection,), daemon=True).start()
+
+    def shutdown(self) -> None:
+        """
+        Stops accepting connections, closes the listening socket and every accepted connection.
+        """
+        self._running = False
+        with self._lock:
+            sockets = [self._server, *self._connections]
+            self._connections.clear()
+        for sock in sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+        if isinstance(self.address, str) and os.path.exists(self.address):
+            os.unlink(self.address)
+
+    def _serve_connection(self, connection: socket.socket) -> None:
+        with self._lock:
+            if not self._running:
+                connection.close()
+                return
+            self._connections.add(connection)
+        try:
+            while True:
+                message_type, batch_id, payload = _recv_frame(connection)
+                if message_type != EVALUATE:
+                    _send_frame(connection, ERROR, batch_id, b"Error: Unexpected message type.")
+                    continue
+                try:
+                    fitness_values = self.fitness_function.evaluate_batch(decode_genomes(payload))
+                    response = _pack_array(array('d', fitness_values))
+                except Exception as error:
+                    _send_frame(connection, ERROR, batch_id, repr(error).encode())
+                    continue
+                _send_frame(connection, RESULT, batch_id, response)
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            with self._lock:
+                self._connections.discard(connection)
+            connection.close()
+
+
+class DistributedFitness(FitnessStrategy):
+    """
+    Fans batches of genomes out to EvaluationWorkers.
+
+    Connections are opened on first use and reused across evaluations. Each connection has
+    at most `max_in_flight` batches outstanding, so a slow worker is never flooded while the
+    others keep pulling work. When a worker dies its outstanding batches are reassigned to
+    the remaining workers; a worker that comes back is reconnected on the next evaluation.
+
+    A worker that does not reply within `timeout` seconds (a hung or unreachable host, or a
+    fitness function slower than the timeout) is treated as alive but unresponsive: its batches
+    are reassigned and it is not used again until the next evaluation. Every batch can be
+    reassigned at most `max_retries` times before `WorkerError` is raised.
+    """
+
+    def __init__(self, addresses: list, batch_size: int = 32, max_in_flight: int = 2, timeout: float = 60.0,
+                 max_retries: int = 3):
+        """
+        Parameters:
+            addresses (list): Worker addresses, (host, port) tuples or Unix socket paths.
+            batch_size (int): The number of genomes sent in one frame.
+            max_in_flight (int): The number of batches a single worker may have outstanding.
+            timeout (float): Seconds to wait for each reply before giving up on a worker. It must exceed the time
+                a worker needs to evaluate one batch. None waits forever, so a hung host blocks the evaluation.
+            max_retries (int): The number of times a single batch may be reassigned after its worker
+                died or timed out.
+        """
+        self.addresses = list(addresses)
+        self.batch_size = batch_size
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self._connections = {}
+        self._lock = threading.Lock()
+
+    def evaluate(self, genome: list) -> float:
+        return self.evaluate_batch([genome])[0]
+
+    def evaluate_batch(self, genomes: list) -> list:
+        results = [None] * len(genomes)
+        pending = queue.Queue()
+        for batch_id, start in enumerate(range(0, len(genomes), self.batch_size)):
+            pending.put((batch_id, start, genomes[start:start + self.batch_size]))
+        errors = []
+        # Number of times each batch has been reassigned, and the workers that timed out in this evaluation
+        retries = {}
+        timed_out = set()
+
+        # Keep dispatching until every batch is done; a round ends early when a worker dies or times out
+        while not pending.empty():
+            self._connect(exclude=timed_out)
+            if not self._connections:
+                if timed_out:
+                    raise WorkerError(f"Error: Every reachable worker timed out after {self.timeout} seconds.")
+                raise ConnectionError("Error: No evaluation workers are reachable.")
+            threads = [threading.Thread(target=self._dispatch,
+                                        args=(address, connection, pending, results, errors, retries, timed_out))
+                       for address, connection in list(self._connections.items())]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            if errors:
+                raise WorkerError(errors[0])
+        if any(fitness is None for fitness in results):
+            raise WorkerError("Error: Some genomes were not evaluated.")
+        return results
+
+    def close(self) -> None:
+        """
+        Closes every worker connection.
+        """
+        for connection in self._connections.values():
+            connection.close()
+        self._connections.clear()
+
+    def _connect(self, exclude: set = ()) -> None:
+        for address in self.addresses:
+            if address in self._connections or address in exclude:
+                continue
+            connection = _create_socket(address)
+            connection.settimeout(self.timeout)
+            try:
+                connection.connect(address)
+            except OSError:
+                connection.close()
+                continue
+            if not isinstance(address, str):
+                connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._connections[address] = connection
+
+    def _dispatch(self, address, connection: socket.socket, pending: queue.Queue, results: list, errors: list,
+                  retries: dict, timed_out: set) -> None:
+        in_flight = deque()
+        try:
+            while True:
+                # Fill the window of outstanding batches for this worker
+                while len(in_flight) < self.max_in_flight and not errors:
+                    try:
+                        batch = pending.get_nowait()
+                    except queue.Empty:
+                        break
+                    in_flight.append(batch)
+                    _send_frame(connection, EVALUATE, batch[0], encode_genomes(batch[2]))
+                if not in_flight:
+                    return
+                message_type, batch_id, payload = _recv_frame(connection)
+                batch = in_flight.popleft()
+                if batch_id != batch[0]:
+                    raise ValueError(f"Error: Expected a reply for batch {batch[0]}, got batch {batch_id}.")
+                if message_type == ERROR:
+                    errors.append(f"Worker {address} failed on batch {batch[0]}: {payload.decode(errors='replace')}")
+                    # Drain the remaining replies so the connection can be reused
+                    while in_flight:
+                        _recv_frame(connection)
+                        in_flight.popleft()
+                    return
+                fitness_values = _unpack_array('d', payload).tolist()
+                if len(fitness_values) != len(batch[2]):
+                    raise ValueError(f"Error: Expected {len(batch[2])} fitness values for batch {batch[0]}, got {len(fitness_values)}.")
+                results[batch[1]:batch[1] + len(fitness_values)] = fitness_values
+        except socket.timeout:
+            # The worker may still be busy with the batches: stop using it for this evaluation
+            # instead of reconnecting and piling more work onto it
+            timed_out.add(address)
+            self._drop(address, connection)
+            self._reassign(in_flight, pending, errors, retries, f"timed out on worker {address}")
+        except (ConnectionError, OSError):
+            # The worker died: drop its connection and hand its batches to the others
+            self._drop(address, connection)
+            self._reassign(in_flight, pending, errors, retries, f"lost its connection to worker {address}")
+        except Exception as error:
+            # Anything else (e.g. genes that cannot be encoded or a malformed reply) fails the evaluation;
+            # the connection may be out of step, so it is dropped and reopened on the next evaluation
+            errors.append(f"Batch evaluation on worker {address} failed: {error!r}")
+            self._drop(address, connection)
+
+    def _reassign(self, in_flight: deque, pending: queue.Queue, errors: list, retries: dict, reason: str) -> None:
+        for batch in in_flight:
+            with self._lock:
+                retries[batch[0]] = retries.get(batch[0], 0) + 1
+                exhausted = retries[batch[0]] > self.max_retries
+            if exhausted:
+                errors.append(f"Error: Batch {batch[0]} {reason} after {self.max_retries} retries.")
+            else:
+                pending.put(batch)
+
+    def _drop(self, address, connection: socket.socket) -> None:
+        with self._lock:
+            self._connections.pop(address, None)
+        connection.close()
+
+
+def main(argv: list = None) -> None:
+    parser = argparse.ArgumentParser(description="Run a genetic_algorithm_py evaluation worker.")
+    parser.add_argument('--listen', required=True, help="host:port for TCP or unix:/path for a Unix socket")
+    parser.add_argument('--spec', required=True, help="JSON object of DNAStrategy keyword arguments")
+    parser.add_argument('--import', dest='modules', action='append', default=[],
+                        help="module to import before building the DNAStrategy, e.g. one that registers strategies")
+    args = parser.parse_args(argv)
+    for module in args.modules:
+        importlib.import_module(module)
+    worker = EvaluationWorker(parse_address(args.listen), json.loads(args.spec))
+    try:
+        worker.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        worker.shutdown()
+
+
+if __name__ == '__main__':
+    main()
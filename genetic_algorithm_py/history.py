@@ -0,0 +1,302 @@
+"""
+Append-only archive of the evolutionary history of a GeneticAlgorithm run.
+
+The file starts with a header (magic bytes, metadata length, JSON metadata describing the
+genome dtype, genome size and population size). Each generation is then appended as one
+fixed-size block of columns:
+
+    genomes      population_size * genome_size values of the genome dtype
+    fitness      population_size float64 values (NaN when not evaluated or only predicted by a surrogate)
+    parent1      population_size int32 indices into the previous generation (-1 for none)
+    parent2      population_size int32 indices into the previous generation (-1 for none)
+
+Because every block has the same size, `HistoryReader` memory-maps the file and reads any
+generation, individual or lineage directly, without loading the rest of the archive. A
+reader opened during a run sees the generations written so far; `refresh` picks up new ones.
+"""
+import json
+import math
+import mmap
+import struct
+import sys
+from array import array
+from typing import TYPE_CHECKING
+
+# Import Population only for type hinting to prevent circular imports
+if TYPE_CHECKING:
+    from .population import Population
+
+MAGIC = b'GAHIST1\n'
+_METADATA_LENGTH = struct.Struct('<I')
+
+# Genome dtypes: float64, int64, or int32 indices into the DNA genes list
+FLOAT = 'd'
+INT = 'q'
+GENE_INDEX = 'i'
+
+
+def _to_little_endian(values: array) -> bytes:
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little_endian(typecode: str, data) -> list:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tolist()
+
+
+class HistoryRecorder:
+    """
+    Records every generation of a GeneticAlgorithm run to an append-only file.
+    """
+
+    def __init__(self, path: str, dtype: str = None):
+        """
+        Parameters:
+            path (str): The archive file to create; an existing file is overwritten.
+            dtype (str): FLOAT, INT or GENE_INDEX. When None it is inferred from the first population:
+                FLOAT for numeric genes and GENE_INDEX otherwise. INT is only used when passed
+                explicitly, since operators such as GaussianMutation can turn integer genes into floats.
+        """
+        self.path = path
+        self.dtype = dtype
+        self.genome_size = None
+        self.population_size = None
+        self.num_generations = 0
+        self._gene_indices = None
+        self._file = open(path, 'wb')
+
+    def record(self, population: 'Population', parent_indices: list = None) -> None:
+        """
+        Appends a generation to the archive.
+
+        Parameters:
+            population (Population): The evaluated population to record.
+            parent_indices (list): One (parent1, parent2) tuple of indices into the previous
+                generation per individual, or None for the initial population.
+        """
+        individuals = population.individuals
+        if self.num_generations == 0:
+            self._write_header(population)
+        if len(individuals) != self.population_size:
+            raise ValueError("Error: Population size must stay the same across recorded generations.")
+
+        genes = [gene for individual in individuals for gene in individual.genome]
+        if len(genes) != self.population_size * self.genome_size:
+            raise ValueError("Error: Genome size must stay the same across recorded generations.")
+        genes = self._encode_genes(genes)
+
+        # Surrogate predictions are not measurements, so they are archived as missing
+        fitness_values = [math.nan if individual.fitness is None or individual.fitness_is_predicted
+                          else individual.fitness for individual in individuals]
+        if parent_indices is None:
+            parent_indices = [(-1, -1)] * self.population_size
+
+        self._file.write(_to_little_endian(array(self.dtype, genes)))
+        self._file.write(_to_little_endian(array('d', fitness_values)))
+        self._file.write(_to_little_endian(array('i', [parents[0] for parents in parent_indices])))
+        self._file.write(_to_little_endian(array('i', [parents[1] for parents in parent_indices])))
+        # Flush so readers can follow the run while it is in progress (see HistoryReader.refresh)
+        self._file.flush()
+        self.num_generations += 1
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _write_header(self, population: 'Population') -> None:
+        individuals = population.individuals
+        self.population_size = len(individuals)
+        self.genome_size = len(individuals[0].genome)
+        metadata = {'genome_size': self.genome_size, 'population_size': self.population_size}
+        if self.dtype is None:
+            genes = [gene for individual in individuals for gene in individual.genome]
+            if all(type(gene) in (int, bool, float) for gene in genes):
+                self.dtype = FLOAT
+            else:
+                self.dtype = GENE_INDEX
+        if self.dtype == GENE_INDEX:
+            gene_pool = population.dna.get_genes()
+            self._gene_indices = {gene: index for index, gene in enumerate(gene_pool)}
+            metadata['genes'] = gene_pool
+        metadata['dtype'] = self.dtype
+        encoded = json.dumps(metadata).encode()
+        self._file.write(MAGIC + _METADATA_LENGTH.pack(len(encoded)) + encoded)
+
+    def _encode_genes(self, genes: list) -> list:
+        # Check every gene before anything is written, so a bad generation never corrupts the archive
+        if self.dtype == GENE_INDEX:
+            try:
+                return [self._gene_indices[gene] for gene in genes]
+            except (KeyError, TypeError):
+                raise ValueError("Error: Genome contains a gene that is not in the DNA genes; "
+                                 "record with dtype FLOAT for numeric genes.") from None
+        if self.dtype == INT:
+            if not all(type(gene) in (int, bool) for gene in genes):
+                raise ValueError("Error: Genome contains non-integer genes; record with dtype FLOAT instead of INT.")
+        elif not all(type(gene) in (int, bool, float) for gene in genes):
+            raise ValueError("Error: Genome contains non-numeric genes; record with dtype GENE_INDEX instead of FLOAT.")
+        return genes
+
+
+class HistoryReader:
+    """
+    Reads a history archive lazily through a memory map.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = None
+        self.refresh()
+        if self._map[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"Error: {path} is not a history archive.")
+        offset = len(MAGIC)
+        (length,) = _METADATA_LENGTH.unpack_from(self._map, offset)
+        offset += _METADATA_LENGTH.size
+        metadata = json.loads(self._map[offset:offset + length])
+        self._data_offset = offset + length
+
+        self.dtype = metadata['dtype']
+        self.genome_size = metadata['genome_size']
+        self.population_size = metadata['population_size']
+        self.genes = metadata.get('genes')
+
+        # Byte offsets of each column inside a generation block
+        item_size = struct.calcsize(self.dtype)
+        self._fitness_offset = self.population_size * self.genome_size * item_size
+        self._parent1_offset = self._fitness_offset + self.population_size * 8
+        self._parent2_offset = self._parent1_offset + self.population_size * 4
+        self._block_size = self._parent2_offset + self.population_size * 4
+
+    @property
+    def num_generations(self) -> int:
+        """
+        Number of complete generations in the archive when it was opened or last refreshed.
+        """
+        return (len(self._map) - self._data_offset) // self._block_size
+
+    def refresh(self) -> None:
+        """
+        Re-maps the file to pick up generations appended since it was opened, e.g. by a run in progress.
+        """
+        if self._map is not None:
+            self._map.close()
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def get_generation(self, generation: int) -> tuple[list, list, list]:
+        """
+        Reads one generation.
+
+        Returns:
+            tuple: The genomes, the fitness values and the (parent1, parent2) indices of each individual.
+        """
+        start = self._block_start(generation)
+        genomes = self._decode_genes(self._map[start:start + self._fitness_offset])
+        genomes = [genomes[i * self.genome_size:(i + 1) * self.genome_size] for i in range(self.population_size)]
+        return genomes, self.get_fitness(generation), self.get_parents(generation)
+
+    def get_fitness(self, generation: int) -> list:
+        """
+        Reads only the fitness column of one generation.
+        """
+        start = self._block_start(generation)
+        return _from_little_endian('d', self._map[start + self._fitness_offset:start + self._parent1_offset])
+
+    def get_parents(self, generation: int) -> list:
+        """
+        Reads only the parent columns of one generation as (parent1, parent2) tuples.
+        """
+        start = self._block_start(generation)
+        parent1 = _from_little_endian('i', self._map[start + self._parent1_offset:start + self._parent2_offset])
+        parent2 = _from_little_endian('i', self._map[start + self._parent2_offset:start + self._block_size])
+        return list(zip(parent1, parent2))
+
+    def get_individual(self, generation: int, index: int) -> tuple[list, float, tuple[int, int]]:
+        """
+        Reads a single individual.
+
+        Returns:
+            tuple: The genome, the fitness and the (parent1, parent2) indices of the individual.
+        """
+        self._check_index(index)
+        start = self._block_start(generation)
+        item_size = struct.calcsize(self.dtype)
+        genome_start = start + index * self.genome_size * item_size
+        genome = self._decode_genes(self._map[genome_start:genome_start + self.genome_size * item_size])
+        (fitness,) = struct.unpack_from('<d', self._map, start + self._fitness_offset + index * 8)
+        (parent1,) = struct.unpack_from('<i', self._map, start + self._parent1_offset + index * 4)
+        (parent2,) = struct.unpack_from('<i', self._map, start + self._parent2_offset + index * 4)
+        return genome, fitness, (parent1, parent2)
+
+    def get_lineage(self, generation: int, index: int, depth: int = None) -> list[tuple[int, list]]:
+        """
+        Traces the ancestors of an individual back through the recorded parent indices.
+
+        Parameters:
+            generation (int): The generation of the individual.
+            index (int): The index of the individual in that generation.
+            depth (int): The number of generations to go back, or None to go back to the start.
+
+        Returns:
+            list: (generation, sorted ancestor indices) tuples, starting with the individual itself.
+        """
+        self._check_index(index)
+        generation = self._normalize_generation(generation)
+        lineage = [(generation, [index])]
+        members = {index}
+        while generation > 0 and (depth is None or len(lineage) <= depth):
+            start = self._block_start(generation)
+            ancestors = set()
+            for member in members:
+                for offset in (self._parent1_offset, self._parent2_offset):
+                    (parent,) = struct.unpack_from('<i', self._map, start + offset + member * 4)
+                    if parent >= 0:
+                        ancestors.add(parent)
+            if not ancestors:
+                break
+            generation -= 1
+            members = ancestors
+            lineage.append((generation, sorted(members)))
+        return lineage
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _normalize_generation(self, generation: int) -> int:
+        num_generations = self.num_generations
+        if generation < 0:
+            generation += num_generations
+        if not 0 <= generation < num_generations:
+            raise IndexError("Error: Generation index out of range.")
+        return generation
+
+    def _check_index(self, index: int) -> None:
+        if not 0 <= index < self.population_size:
+            raise IndexError("Error: Individual index out of range.")
+
+    def _block_start(self, generation: int) -> int:
+        return self._data_offset + self._normalize_generation(generation) * self._block_size
+
+    def _decode_genes(self, data) -> list:
+        genes = _from_little_endian(self.dtype, data)
+        if self.dtype == GENE_INDEX:
+            return [self.genes[gene] for gene in genes]
+        return genes
@@ -9,33 +9,73 @@ class Individual:
     Represents an individual in the genetic algorithm, defined by its DNA and fitness score.
     Each individual has a genome, which is evaluated for fitness based on the fitness function
     defined in the DNA strategy.
+
+    Fitness is evaluated lazily. A dirty flag marks genomes that have not been scored yet, so
+    each version of a genome is evaluated at most once, usually in bulk by the population.
     """
 
-    def __init__(self, dna: 'DNA', genome_size: int):
+    def __init__(self, dna: 'DNA', genome_size: int, genome: list = None):
         """
-        Initializes an individual with DNA and a randomly generated genome.
-        Calculates fitness if a fitness function is defined.
-        
+        Initializes an individual with DNA and a genome. Fitness is not evaluated until it is needed.
+
         Parameters:
             dna (DNA): The DNA strategy to be used for generating and evaluating the genome.
             genome_size (int): The length of the genome.
+            genome (list): An existing genome to use instead of generating a random one.
         """
         self.dna = dna
-        self.genome = self.generate_genome(genome_size)
-        self.fitness = None
+        self._genome = genome if genome is not None else self.generate_genome(genome_size)
+        self._fitness = None
+        self._dirty = True
+        # True when the fitness was predicted by a surrogate rather than evaluated
+        self.fitness_is_predicted = False
+
+    @property
+    def genome(self) -> list:
+        return self._genome
+
+    @genome.setter
+    def genome(self, genome: list):
+        # A new genome invalidates the current fitness
+        self._genome = genome
+        self._dirty = True
+
+    @property
+    def fitness(self) -> float:
+        """
+        The fitness of the individual, evaluated on first access after the genome changed.
+        """
+        if self._dirty and self.dna.get_fitness_function() is not None:
+            self.calculate_fitness()
+        return self._fitness
+
+    @fitness.setter
+    def fitness(self, fitness: float):
+        # Fitness assigned from outside (e.g. a batch evaluation) belongs to the current genome
+        self._fitness = fitness
+        self._dirty = False
+        self.fitness_is_predicted = False
 
-        # Calculate fitness if a fitness function is available
-        fitness_function = self.dna.get_fitness_function()
-        if fitness_function is not None:
-            self.fitness = self.calculate_fitness()
+    @property
+    def is_dirty(self) -> bool:
+        """
+        True when the genome has changed since its fitness was last evaluated.
+        """
+        return self._dirty
+
+    def invalidate_fitness(self) -> None:
+        """
+        Marks the fitness as stale after the genome was modified in place.
+        """
+        self._dirty = True
 
     def generate_genome(self, genome_size: int) -> list:
         """
         Generates a genome of the specified size using the DNA strategy.
-        
+
         Parameters:
             genome_size (int): The size of the genome to be generated.
-        
+
         Returns:
             list: The generated genome.
         """
@@ -44,9 +84,9 @@ class Individual:
     def calculate_fitness(self) -> float:
         """
         Calculates and returns the fitness of the individual based on its genome.
-        
+
         Returns:
             float: The fitness score of the individual.
         """
         self.fitness = self.dna.get_fitness_function().evaluate(self.genome)
-        return self.fitness
+        return self._fitness
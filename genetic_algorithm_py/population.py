@@ -20,20 +20,29 @@ class Population:
             population_size (int): The number of individuals in the population.
             genome_size (int): The length of the genome for each individual.
         """
+        self.dna = dna
         self.individuals = [Individual(dna, genome_size) for _ in range(population_size)]
 
     def evaluate_population(self) -> None:
         """
-        Evaluates the fitness of each individual in the population.
+        Evaluates, as a single batch, every individual whose genome changed since its last evaluation.
         """
-        for individual in self.individuals:
-            individual.calculate_fitness()
+        fitness_function = self.dna.get_fitness_function()
+        dirty_individuals = [individual for individual in self.individuals if individual.is_dirty]
+        if fitness_function is None or not dirty_individuals:
+            return
+        fitness_function.evaluate_individuals(dirty_individuals)
 
     def get_best_individual(self) -> Individual:
         """
         Finds and returns the individual with the highest fitness in the population.
+        A fitness predicted by a surrogate is confirmed with a real evaluation before it can be returned.
         
         Returns:
             Individual: The individual with the highest fitness score.
         """
-        return max(self.individuals, key=lambda ind: ind.fitness)
+        best_individual = max(self.individuals, key=lambda ind: ind.fitness)
+        while best_individual.fitness_is_predicted:
+            self.dna.get_fitness_function().confirm(best_individual)
+            best_individual = max(self.individuals, key=lambda ind: ind.fitness)
+        return best_individual
@@ -2,4 +2,6 @@ from .selection_strategy import SelectionStrategy
 from .mutation_strategy import MutationStrategy
 from .crossover_strategy import CrossoverStrategy
 from .fitness_strategy import FitnessStrategy
-from .dna_strategy import DNAStrategy
\ No newline at end of file
+from .surrogate_strategy import SurrogateStrategy
+from .dna_strategy import DNAStrategy
+from .registry import register_strategy, get_strategy, create_strategy
@@ -1,32 +1,53 @@
 import random
-from ..defaults.selection import RouletteWheelSelection
-from ..defaults.crossover import HalfCrossover
-from ..defaults.mutation import ElementMutation
-from ..defaults.fitness_function import MaximizeOnesFitness
 from .selection_strategy import SelectionStrategy
 from .crossover_strategy import CrossoverStrategy
 from .mutation_strategy import MutationStrategy
 from .fitness_strategy import FitnessStrategy
+from .surrogate_strategy import SurrogateStrategy
+from .registry import resolve_strategy
 
 # DNA Strategy class that defines genetic algorithm behavior
 class DNAStrategy:
     def __init__(self, genes: list, target: list = None,
                 duplicate_genomes: bool = True,
-                selection_strategy: SelectionStrategy = RouletteWheelSelection(),
-                crossover_strategy: CrossoverStrategy = HalfCrossover(),
-                mutation_strategy: MutationStrategy = ElementMutation(),
-                fitness_strategy: FitnessStrategy = MaximizeOnesFitness()):
+                selection_strategy: SelectionStrategy = None,
+                crossover_strategy: CrossoverStrategy = None,
+                mutation_strategy: MutationStrategy = None,
+                fitness_strategy: FitnessStrategy = None,
+                surrogate_strategy: SurrogateStrategy = None,
+                bounds: list = None):
         # Import necessary classes after class definition
-        from ..algorithm import Selection, Crossover, Mutation, FitnessFunction
+        from ..algorithm import Selection, Crossover, Mutation, FitnessFunction, SurrogateFitnessFunction
+        # Resolve strategy names, and create fresh defaults so no instance is shared between DNAStrategy objects
+        # Continuous benchmark functions are negated and so never positive, which fitness-proportional
+        # selection cannot rank; tournaments only compare fitness values
+        selection_strategy = resolve_strategy(selection_strategy,
+                                              'RouletteWheelSelection' if bounds is None else 'TournamentSelection',
+                                              SelectionStrategy)
+        crossover_strategy = resolve_strategy(crossover_strategy, 'HalfCrossover', CrossoverStrategy)
+        mutation_strategy = resolve_strategy(mutation_strategy, 'ElementMutation', MutationStrategy)
+        fitness_strategy = resolve_strategy(fitness_strategy, 'MaximizeOnesFitness', FitnessStrategy)
+        surrogate_strategy = resolve_strategy(surrogate_strategy, strategy_type=SurrogateStrategy)
         # Initialize strategy objects
         self.selection = Selection(selection_strategy)
         self.crossover = Crossover(crossover_strategy)
         self.mutation = Mutation(mutation_strategy)
-        self.fitness_function = FitnessFunction(fitness_strategy)
+        # Put the surrogate in front of the fitness strategy when one is given
+        if surrogate_strategy is not None:
+            self.fitness_function = SurrogateFitnessFunction(fitness_strategy, surrogate_strategy)
+        else:
+            self.fitness_function = FitnessFunction(fitness_strategy)
         # Initialize genes, target, and genome duplication flag
         self.genes = genes
         self.target = target
         self.duplicate_genomes = duplicate_genomes
+        # Bounds switch to continuous mode: either one (low, high) pair for every dimension or one pair per dimension
+        self.bounds = bounds
+        if bounds is not None:
+            if any(low >= high for low, high in self._bound_pairs()):
+                raise ValueError("Error: Each lower bound must be less than its upper bound.")
+        elif genes is None:
+            raise ValueError("Error: Either genes or bounds must be given.")
 
     # Prevent subclass from overriding __init__ method
     def __init_subclass__(cls, **kwargs):
@@ -37,6 +58,9 @@ class DNAStrategy:
 
     # Generate a genome of specified size
     def generate_genome(self, genome_size: int) -> list:
+        if self.bounds is not None:
+            # In continuous mode, sample each dimension uniformly within its bounds
+            return [random.uniform(low, high) for low, high in self.get_bounds(genome_size)]
         if self.duplicate_genomes:
             # If duplicates are allowed, select genes with replacement
             return random.choices(self.genes, k=genome_size)
@@ -49,6 +73,35 @@ class DNAStrategy:
                 random.shuffle(self.genes)
                 return self.genes[:genome_size]
 
-    # Get a list of random genes
-    def get_random_genes(self, genes_size: int = 1) -> list:
+    # Get a list of random genes for the positions starting at index
+    def get_random_genes(self, genes_size: int = 1, index: int = 0) -> list:
+        if self.bounds is not None:
+            # In continuous mode, sample each gene within the bounds of the dimension it is meant for
+            pairs = self._bound_pairs()
+            return [random.uniform(*pairs[position % len(pairs)]) for position in range(index, index + genes_size)]
         return random.choices(self.genes, k=genes_size)
+
+    # Get the (low, high) bounds of every dimension, or None outside continuous mode
+    def get_bounds(self, genome_size: int) -> list:
+        if self.bounds is None:
+            return None
+        pairs = self._bound_pairs()
+        if isinstance(self.bounds[0], (int, float)):
+            # A single (low, high) pair applies to every dimension
+            return pairs * genome_size
+        if len(pairs) != genome_size:
+            raise ValueError("Error: Number of bounds must match the genome size.")
+        return pairs
+
+    # Clip every gene of a genome into its bounds
+    def clip_genome(self, genome: list) -> list:
+        bounds = self.get_bounds(len(genome))
+        if bounds is None:
+            return list(genome)
+        return [min(max(gene, low), high) for gene, (low, high) in zip(genome, bounds)]
+
+    # Normalize bounds to a list of (low, high) tuples
+    def _bound_pairs(self) -> list:
+        if isinstance(self.bounds[0], (int, float)):
+            return [(float(self.bounds[0]), float(self.bounds[1]))]
+        return [(float(low), float(high)) for low, high in self.bounds]
@@ -5,3 +5,11 @@ class FitnessStrategy:
         This method should be overridden by subclasses to implement specific fitness calculations.
         """
         raise NotImplementedError("Subclasses must implement the evaluate method.")
+
+    def evaluate_batch(self, genomes:list)->list:
+        """Evaluate the fitness of several genomes at once.
+
+        The default implementation calls `evaluate` for each genome. Subclasses can override it
+        when a batch can be scored more cheaply than one genome at a time.
+        """
+        return [self.evaluate(genome) for genome in genomes]
@@ -0,0 +1,54 @@
+# Strategies registered by name, plus the built-in defaults resolved so far
+_registry = {}
+
+def register_strategy(name: str, strategy_class: type) -> None:
+    """Register a strategy class so that it can be resolved by name.
+
+    Args:
+        name (str): The name used to look up the strategy.
+        strategy_class (type): The strategy class to create for that name.
+    """
+    _registry[name] = strategy_class
+
+def get_strategy(name: str) -> type:
+    """Return the strategy class registered under `name`.
+
+    Registered strategies take precedence over the built-in defaults, which are
+    imported only when first requested.
+
+    Raises:
+        ValueError: If no strategy is known by that name.
+    """
+    strategy_class = _registry.get(name)
+    if strategy_class is None:
+        from .. import defaults
+        # Only the exported strategies are valid names, not any attribute of the package
+        if name not in defaults.__all__:
+            raise ValueError(f"Error: Unknown strategy '{name}'.")
+        strategy_class = getattr(defaults, name)
+        # Remember the default so later lookups are a single dictionary access
+        _registry[name] = strategy_class
+    return strategy_class
+
+def create_strategy(name: str, *args, **kwargs):
+    """Create a new instance of the strategy registered under `name`."""
+    return get_strategy(name)(*args, **kwargs)
+
+def resolve_strategy(strategy, default_name: str = None, strategy_type: type = None):
+    """Return a strategy instance for a strategy object, a strategy name or None.
+
+    Names are resolved to a new instance, and None falls back to a new instance of
+    `default_name` (or None when no default is given).
+
+    Raises:
+        TypeError: If `strategy_type` is given and the strategy is not an instance of it.
+    """
+    if strategy is None:
+        if default_name is None:
+            return None
+        strategy = default_name
+    if isinstance(strategy, str):
+        strategy = create_strategy(strategy)
+    if strategy_type is not None and not isinstance(strategy, strategy_type):
+        raise TypeError(f"Error: {type(strategy).__name__} is not a {strategy_type.__name__}.")
+    return strategy
@@ -14,3 +14,23 @@ class SelectionStrategy:
             tuple: A tuple containing two selected parents (Individual).
         """
         raise NotImplementedError("This method should be overridden by subclasses")
+
+    def select_parent_indices(self, population: Population, num_pairs: int) -> list[tuple[int, int]]:
+        """Select parent pairs for a whole generation as indices into the population.
+
+        The default implementation calls `select_parents` once per pair. Subclasses that can
+        draw a full generation in a single pass should override this method.
+
+        Args:
+            population (Population): The population from which parents are selected.
+            num_pairs (int): The number of parent pairs to select.
+
+        Returns:
+            list: A list of `num_pairs` tuples, each holding the indices of two parents.
+        """
+        positions = {id(individual): index for index, individual in enumerate(population.individuals)}
+        parent_indices = []
+        for _ in range(num_pairs):
+            parent1, parent2 = self.select_parents(population)
+            parent_indices.append((positions[id(parent1)], positions[id(parent2)]))
+        return parent_indices
@@ -0,0 +1,36 @@
+class SurrogateStrategy:
+    def __init__(self, evaluation_fraction: float = 0.25, min_samples: int = 20, audit_fraction: float = 0.05):
+        """Initialize the surrogate strategy.
+
+        Args:
+            evaluation_fraction (float): The fraction of each batch, ranked best first by the
+                surrogate, that is sent to the real fitness function.
+            min_samples (int): The number of real evaluations to collect before the surrogate
+                is trusted to pre-screen genomes. Must be at least 1.
+            audit_fraction (float): The fraction of the screened-out genomes that is still sent,
+                at random, to the real fitness function to measure the surrogate's accuracy.
+
+        Raises:
+            ValueError: If min_samples is less than 1 or a fraction is outside [0, 1].
+        """
+        if min_samples < 1:
+            raise ValueError("Error: min_samples must be at least 1.")
+        if not 0 < evaluation_fraction <= 1 or not 0 <= audit_fraction <= 1:
+            raise ValueError("Error: evaluation_fraction must be in (0, 1] and audit_fraction in [0, 1].")
+        self.evaluation_fraction = evaluation_fraction
+        self.min_samples = min_samples
+        self.audit_fraction = audit_fraction
+
+    def update(self, genomes: list, fitness_values: list) -> None:
+        """Train the surrogate on genomes whose real fitness is known.
+
+        This method should be overridden by subclasses to implement specific surrogate models.
+        """
+        raise NotImplementedError("Surrogate strategy must implement the update method.")
+
+    def predict(self, genomes: list) -> list:
+        """Predict the fitness of each genome.
+
+        This method should be overridden by subclasses to implement specific surrogate models.
+        """
+        raise NotImplementedError("Surrogate strategy must implement the predict method.")
@@ -0,0 +1,96 @@
+import contextlib
+import io
+import random
+import unittest
+
+from genetic_algorithm_py import DNA, GeneticAlgorithm, Individual, Mutation, Population
+from genetic_algorithm_py.defaults import (
+    ArithmeticCrossover, BlendCrossover, BoundaryMutation, ElementMutation, GaussianMutation, MultiElementMutation,
+    PolynomialMutation, RouletteWheelSelection, ScrambleMutation, SegmentSwapMutation, SimulatedBinaryCrossover,
+    StochasticUniversalSampling, SwapMutation, TournamentSelection, UniformCrossover,
+)
+from genetic_algorithm_py.strategy import DNAStrategy
+
+BOUNDS = [(-1, 1), (0, 2), (5, 6)]
+
+
+def in_bounds(genome, bounds=BOUNDS):
+    return all(type(gene) is float and low <= gene <= high for gene, (low, high) in zip(genome, bounds))
+
+
+class ContinuousModeTest(unittest.TestCase):
+    def setUp(self):
+        random.seed(7)
+        self.dna = DNA(DNAStrategy(genes=None, bounds=BOUNDS, fitness_strategy="SphereFitness"))
+
+    def individual(self, genome=None):
+        return Individual(self.dna, len(BOUNDS), genome)
+
+    def test_random_genes_use_the_bounds_of_each_dimension(self):
+        for _ in range(200):
+            self.assertTrue(in_bounds(self.dna.get_random_genes(3, 0)))
+            (gene,) = self.dna.get_random_genes(1, 2)
+            self.assertTrue(5 <= gene <= 6)
+            self.assertTrue(in_bounds(self.dna.generate_genome(3)))
+
+    def test_mutations_keep_genes_in_bounds(self):
+        strategies = [ElementMutation(1.0), MultiElementMutation(1.0), ScrambleMutation(1.0), SwapMutation(1.0),
+                      SegmentSwapMutation(1.0), GaussianMutation(1.0, sigma=5.0), BoundaryMutation(1.0),
+                      PolynomialMutation(1.0)]
+        for strategy in strategies:
+            mutation = Mutation(strategy)
+            for _ in range(200):
+                individual = self.individual()
+                mutation.mutate(individual)
+                self.assertTrue(in_bounds(individual.genome), (type(strategy).__name__, individual.genome))
+
+    def test_boundary_mutation_defaults(self):
+        # Without DNA bounds the genes are drawn from [-1, 1]
+        dna = DNA(DNAStrategy(genes=[0.0, 0.5]))
+        individual = Individual(dna, 50)
+        BoundaryMutation(1.0).mutate(individual)
+        self.assertTrue(all(-1 <= gene <= 1 for gene in individual.genome))
+        # Explicit boundaries override the DNA bounds
+        individual = self.individual()
+        BoundaryMutation(1.0, min_value=0.25, max_value=0.5).mutate(individual)
+        self.assertTrue(all(0.25 <= gene <= 0.5 for gene in individual.genome))
+
+    def test_crossovers_keep_genes_in_bounds(self):
+        strategies = [SimulatedBinaryCrossover(crossover_rate=1.0), BlendCrossover(alpha=2.0), ArithmeticCrossover(),
+                      UniformCrossover()]
+        for strategy in strategies:
+            for _ in range(200):
+                for offspring in strategy.crossover(self.individual(), self.individual()):
+                    self.assertTrue(in_bounds(offspring.genome), (type(strategy).__name__, offspring.genome))
+
+    def test_sbx_with_parents_out_of_bounds(self):
+        crossover = SimulatedBinaryCrossover(crossover_rate=1.0)
+        for _ in range(500):
+            parent1 = self.individual([50.0, -3.0, 5.5])
+            parent2 = self.individual([150.0, 1.0, 7.0])
+            for offspring in crossover.crossover(parent1, parent2):
+                self.assertTrue(in_bounds(offspring.genome), offspring.genome)
+
+    def test_proportional_selection_favours_fitter_individuals_with_negative_fitness(self):
+        population = Population(self.dna, 10, len(BOUNDS))
+        for rank, individual in enumerate(population.individuals):
+            individual.fitness = -100.0 + 10 * rank
+        for strategy in (RouletteWheelSelection(), StochasticUniversalSampling()):
+            picks = [index for pair in strategy.select_parent_indices(population, 500) for index in pair]
+            self.assertEqual(picks.count(0), 0, type(strategy).__name__)
+            self.assertGreater(picks.count(9), picks.count(1), type(strategy).__name__)
+
+    def test_continuous_defaults_improve_fitness(self):
+        strategy = DNAStrategy(genes=None, bounds=(-5.12, 5.12), fitness_strategy="RastriginFitness")
+        self.assertIsInstance(strategy.selection.selection_strategy, TournamentSelection)
+        ga = GeneticAlgorithm(DNA(strategy), population_size=20, genome_size=5, mutation_rate=0.2)
+        ga.population.evaluate_population()
+        initial_mean = sum(ind.fitness for ind in ga.population.individuals) / 20
+        with contextlib.redirect_stdout(io.StringIO()):
+            ga.run(20)
+        final_mean = sum(ind.fitness for ind in ga.population.individuals) / 20
+        self.assertGreater(final_mean, initial_mean / 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
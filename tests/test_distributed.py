@@ -0,0 +1,154 @@
+import multiprocessing
+import os
+import random
+import tempfile
+import threading
+import time
+import unittest
+
+from genetic_algorithm_py.defaults import RastriginFitness
+from genetic_algorithm_py.distributed import DistributedFitness, EvaluationWorker, WorkerError
+from genetic_algorithm_py.strategy import DNAStrategy, FitnessStrategy
+
+SPEC = {"genes": None, "bounds": [-5.12, 5.12], "fitness_strategy": "RastriginFitness"}
+
+
+class SlowSumFitness(FitnessStrategy):
+    def evaluate(self, genome):
+        time.sleep(0.005)
+        return sum(genome)
+
+
+class SleepyFitness(FitnessStrategy):
+    def evaluate(self, genome):
+        time.sleep(0.3)
+        return sum(genome)
+
+
+def serve_in_process(address, ready):
+    # Runs in a forked child so the test can kill the worker mid-batch
+    worker = EvaluationWorker(address, DNAStrategy(genes=[0, 1], fitness_strategy=SlowSumFitness()))
+    ready.set()
+    worker.serve_forever()
+
+
+class DistributedFitnessTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.workers = []
+        self.processes = []
+
+    def tearDown(self):
+        for worker in self.workers:
+            worker.shutdown()
+        for process in self.processes:
+            process.kill()
+            process.join()
+        self.directory.cleanup()
+
+    def start_worker(self, address, spec=SPEC):
+        worker = EvaluationWorker(address, spec)
+        threading.Thread(target=worker.serve_forever, daemon=True).start()
+        self.workers.append(worker)
+        return worker.address
+
+    def start_worker_process(self, name):
+        context = multiprocessing.get_context("fork")
+        address = os.path.join(self.directory.name, name)
+        ready = context.Event()
+        process = context.Process(target=serve_in_process, args=(address, ready), daemon=True)
+        process.start()
+        self.assertTrue(ready.wait(5))
+        self.processes.append(process)
+        return address, process
+
+    def random_genomes(self, count, size=6):
+        return [[random.uniform(-5.12, 5.12) for _ in range(size)] for _ in range(count)]
+
+    def test_results_match_local_evaluation(self):
+        addresses = [
+            self.start_worker(("127.0.0.1", 0)),
+            self.start_worker(("127.0.0.1", 0)),
+            self.start_worker(os.path.join(self.directory.name, "worker.sock")),
+        ]
+        fitness = DistributedFitness(addresses, batch_size=7)
+        try:
+            genomes = self.random_genomes(100)
+            self.assertEqual(fitness.evaluate_batch(genomes), RastriginFitness().evaluate_batch(genomes))
+            # Connections are reused across evaluations
+            self.assertEqual(len(fitness._connections), 3)
+            self.assertEqual(fitness.evaluate(genomes[0]), RastriginFitness().evaluate(genomes[0]))
+        finally:
+            fitness.close()
+
+    def test_killed_worker_batches_are_reassigned(self):
+        (address1, process1), (address2, _) = self.start_worker_process("a.sock"), self.start_worker_process("b.sock")
+        fitness = DistributedFitness([address1, address2], batch_size=5)
+        genomes = [[random.randint(0, 1) for _ in range(8)] for _ in range(200)]
+        threading.Timer(0.2, process1.kill).start()
+        try:
+            results = fitness.evaluate_batch(genomes)
+        finally:
+            fitness.close()
+        self.assertEqual(results, [float(sum(genome)) for genome in genomes])
+
+    def test_timed_out_worker_is_not_retried_forever(self):
+        slow = self.start_worker(("127.0.0.1", 0), DNAStrategy(genes=[0, 1], fitness_strategy=SleepyFitness()))
+        fitness = DistributedFitness([slow], batch_size=1, timeout=0.1)
+        start = time.monotonic()
+        try:
+            with self.assertRaises(WorkerError):
+                fitness.evaluate_batch([[0, 1], [1, 1]])
+        finally:
+            fitness.close()
+        self.assertLess(time.monotonic() - start, 2)
+
+    def test_timed_out_batches_are_reassigned(self):
+        slow = self.start_worker(("127.0.0.1", 0), DNAStrategy(genes=[0, 1], fitness_strategy=SleepyFitness()))
+        fast = self.start_worker(("127.0.0.1", 0), DNAStrategy(genes=[0, 1], fitness_strategy=SlowSumFitness()))
+        genomes = [[random.randint(0, 1) for _ in range(4)] for _ in range(20)]
+        fitness = DistributedFitness([slow, fast], batch_size=2, timeout=0.1)
+        try:
+            self.assertEqual(fitness.evaluate_batch(genomes), [float(sum(genome)) for genome in genomes])
+        finally:
+            fitness.close()
+        # Without retries the batches of the slow worker fail the evaluation
+        fitness = DistributedFitness([slow, fast], batch_size=2, timeout=0.1, max_retries=0)
+        try:
+            with self.assertRaises(WorkerError):
+                fitness.evaluate_batch(genomes)
+        finally:
+            fitness.close()
+
+    def test_worker_failure_raises_worker_error(self):
+        fitness = DistributedFitness([self.start_worker(("127.0.0.1", 0))], batch_size=2)
+        try:
+            with self.assertRaises(WorkerError):
+                fitness.evaluate_batch([[0.5, 0.5], [0.5, 0.5], ["x", "y"]])
+            # Genes that cannot be encoded fail on the master instead of returning None
+            with self.assertRaises(WorkerError):
+                fitness.evaluate_batch([[0.5, 0.5], [0.5, 0.5], [1j, 0.5], [0.5, 0.5]])
+            # The connection recovers for the next evaluation
+            self.assertEqual(fitness.evaluate_batch([[0.0, 0.0]]), [-0.0])
+        finally:
+            fitness.close()
+
+    def test_no_reachable_worker(self):
+        address = self.start_worker(("127.0.0.1", 0))
+        self.workers.pop().shutdown()
+        with self.assertRaises(ConnectionError):
+            DistributedFitness([address]).evaluate_batch([[0.0]])
+
+    def test_shutdown_closes_accepted_connections(self):
+        fitness = DistributedFitness([self.start_worker(("127.0.0.1", 0))], timeout=5)
+        try:
+            fitness.evaluate_batch([[0.0]])
+            self.workers.pop().shutdown()
+            with self.assertRaises(ConnectionError):
+                fitness.evaluate_batch([[0.0]])
+        finally:
+            fitness.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
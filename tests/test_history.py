@@ -0,0 +1,113 @@
+import contextlib
+import io
+import math
+import os
+import random
+import tempfile
+import unittest
+
+from genetic_algorithm_py import DNA, GeneticAlgorithm, Population
+from genetic_algorithm_py.defaults import KNNSurrogate
+from genetic_algorithm_py.history import FLOAT, GENE_INDEX, HistoryReader, HistoryRecorder
+from genetic_algorithm_py.strategy import DNAStrategy, FitnessStrategy
+
+# Each individual of a generation descends from the individuals at these indices of the previous one
+PARENTS = [(0, 1), (1, 2), (2, 3), (3, 0)]
+
+
+class CountAFitness(FitnessStrategy):
+    def evaluate(self, genome):
+        return float(genome.count("a"))
+
+
+class HistoryArchiveTest(unittest.TestCase):
+    def setUp(self):
+        random.seed(11)
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "run.gah")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def record_generations(self, dna, num_generations):
+        generations = []
+        with HistoryRecorder(self.path) as recorder:
+            for generation in range(num_generations):
+                population = Population(dna, 4, 3)
+                population.evaluate_population()
+                recorder.record(population, None if generation == 0 else PARENTS)
+                generations.append(population)
+        return generations
+
+    def test_round_trip(self):
+        dna = DNA(DNAStrategy(genes=None, bounds=(-1, 1), fitness_strategy="SphereFitness"))
+        generations = self.record_generations(dna, 5)
+        with HistoryReader(self.path) as reader:
+            self.assertEqual(reader.dtype, FLOAT)
+            self.assertEqual((reader.num_generations, reader.population_size, reader.genome_size), (5, 4, 3))
+            for number, population in enumerate(generations):
+                genomes, fitness, parents = reader.get_generation(number)
+                self.assertEqual(genomes, [individual.genome for individual in population.individuals])
+                self.assertEqual(fitness, [individual.fitness for individual in population.individuals])
+                self.assertEqual(parents, [(-1, -1)] * 4 if number == 0 else PARENTS)
+            individual = generations[2].individuals[1]
+            self.assertEqual(reader.get_individual(2, 1), (individual.genome, individual.fitness, PARENTS[1]))
+            # Negative generation indices count from the end
+            self.assertEqual(reader.get_generation(-1), reader.get_generation(4))
+            self.assertEqual(reader.get_individual(-5, 0)[2], (-1, -1))
+            with self.assertRaises(IndexError):
+                reader.get_generation(5)
+            with self.assertRaises(IndexError):
+                reader.get_individual(0, 4)
+
+    def test_lineage(self):
+        dna = DNA(DNAStrategy(genes=None, bounds=(-1, 1), fitness_strategy="SphereFitness"))
+        self.record_generations(dna, 4)
+        with HistoryReader(self.path) as reader:
+            self.assertEqual(reader.get_lineage(3, 0), [(3, [0]), (2, [0, 1]), (1, [0, 1, 2]), (0, [0, 1, 2, 3])])
+            self.assertEqual(reader.get_lineage(-1, 0, depth=1), [(3, [0]), (2, [0, 1])])
+
+    def test_gene_index_dtype(self):
+        dna = DNA(DNAStrategy(genes=["a", "b", "c"], fitness_strategy=CountAFitness()))
+        generations = self.record_generations(dna, 2)
+        with HistoryReader(self.path) as reader:
+            self.assertEqual(reader.dtype, GENE_INDEX)
+            self.assertEqual(reader.genes, ["a", "b", "c"])
+            genomes, _, _ = reader.get_generation(1)
+            self.assertEqual(genomes, [individual.genome for individual in generations[1].individuals])
+
+    def test_truncated_block_is_ignored_and_refresh_sees_new_generations(self):
+        dna = DNA(DNAStrategy(genes=None, bounds=(-1, 1), fitness_strategy="SphereFitness"))
+        with HistoryRecorder(self.path) as recorder:
+            population = Population(dna, 4, 3)
+            population.evaluate_population()
+            recorder.record(population)
+            with HistoryReader(self.path) as reader:
+                self.assertEqual(reader.num_generations, 1)
+                recorder.record(population, PARENTS)
+                self.assertEqual(reader.num_generations, 1)
+                reader.refresh()
+                self.assertEqual(reader.num_generations, 2)
+        # A block cut short, e.g. by a crash while writing, is not reported as a generation
+        with open(self.path, "ab") as archive:
+            archive.write(b"\0" * 10)
+        with HistoryReader(self.path) as reader:
+            self.assertEqual(reader.num_generations, 2)
+            self.assertEqual(reader.get_parents(-1), PARENTS)
+
+    def test_predicted_fitness_is_recorded_as_missing(self):
+        strategy = DNAStrategy(genes=None, bounds=(-1, 1), fitness_strategy="SphereFitness",
+                               surrogate_strategy=KNNSurrogate(min_samples=10, audit_fraction=0))
+        with HistoryRecorder(self.path) as recorder:
+            ga = GeneticAlgorithm(DNA(strategy), population_size=20, genome_size=3, mutation_rate=0.1, history=recorder)
+            with contextlib.redirect_stdout(io.StringIO()):
+                ga.run(3)
+            predicted = [individual.fitness_is_predicted for individual in ga.population.individuals]
+        with HistoryReader(self.path) as reader:
+            fitness = reader.get_fitness(-1)
+        self.assertTrue(any(predicted))
+        self.assertEqual([math.isnan(value) for value in fitness], predicted)
+
+
+if __name__ == "__main__":
+    unittest.main()
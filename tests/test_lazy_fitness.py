@@ -0,0 +1,55 @@
+import contextlib
+import io
+import random
+import unittest
+
+from genetic_algorithm_py import DNA, GeneticAlgorithm, Individual, Mutation
+from genetic_algorithm_py.defaults import BitFlipMutation, ElementMutation
+from genetic_algorithm_py.strategy import DNAStrategy
+
+
+class LazyFitnessTest(unittest.TestCase):
+    def setUp(self):
+        random.seed(3)
+        self.dna = DNA(DNAStrategy(genes=[0, 1]))
+
+    def evaluated_individual(self):
+        individual = Individual(self.dna, 10)
+        individual.fitness
+        self.assertFalse(individual.is_dirty)
+        return individual
+
+    def test_each_individual_is_evaluated_once_per_generation(self):
+        ga = GeneticAlgorithm(self.dna, population_size=21, genome_size=10, mutation_rate=0.05)
+        with contextlib.redirect_stdout(io.StringIO()):
+            ga.run(5)
+        self.assertEqual(self.dna.get_fitness_function().evaluation_count, 21 * (5 + 1))
+
+    def test_fitness_is_evaluated_on_first_access(self):
+        individual = Individual(self.dna, 10)
+        self.assertTrue(individual.is_dirty)
+        self.assertEqual(self.dna.get_fitness_function().evaluation_count, 0)
+        self.assertEqual(individual.fitness, sum(individual.genome))
+        individual.fitness
+        self.assertEqual(self.dna.get_fitness_function().evaluation_count, 1)
+
+    def test_unchanged_genome_keeps_fitness(self):
+        individual = self.evaluated_individual()
+        Mutation(ElementMutation(0.0)).mutate(individual)
+        self.assertFalse(individual.is_dirty)
+
+    def test_changed_genome_invalidates_fitness(self):
+        individual = self.evaluated_individual()
+        Mutation(BitFlipMutation(1.0)).mutate(individual)
+        self.assertTrue(individual.is_dirty)
+        self.assertEqual(individual.fitness, sum(individual.genome))
+
+    def test_assigning_genome_invalidates_fitness(self):
+        individual = self.evaluated_individual()
+        individual.genome = [1] * 10
+        self.assertTrue(individual.is_dirty)
+        self.assertEqual(individual.fitness, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
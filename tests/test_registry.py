@@ -0,0 +1,48 @@
+import unittest
+
+from genetic_algorithm_py.defaults import BitFlipMutation, TournamentSelection
+from genetic_algorithm_py.strategy import DNAStrategy, SelectionStrategy, create_strategy, get_strategy, register_strategy
+
+
+class FirstTwoSelection(SelectionStrategy):
+    def select_parents(self, population):
+        return population.individuals[0], population.individuals[1]
+
+
+class StrategyRegistryTest(unittest.TestCase):
+    def test_default_strategies_resolve_by_name(self):
+        self.assertIs(get_strategy("TournamentSelection"), TournamentSelection)
+        strategy = create_strategy("TournamentSelection", tournament_size=5)
+        self.assertEqual(strategy.tournament_size, 5)
+
+    def test_unknown_names_are_rejected(self):
+        for name in ("NoSuchSelection", "importlib", "_STRATEGY_MODULES", "__getattr__"):
+            with self.assertRaises(ValueError, msg=name):
+                get_strategy(name)
+
+    def test_registered_strategy(self):
+        register_strategy("FirstTwoSelection", FirstTwoSelection)
+        strategy = DNAStrategy(genes=[0, 1], selection_strategy="FirstTwoSelection")
+        self.assertIsInstance(strategy.selection.selection_strategy, FirstTwoSelection)
+
+    def test_strategy_must_match_its_slot(self):
+        with self.assertRaises(TypeError):
+            DNAStrategy(genes=[0, 1], selection_strategy="BitFlipMutation")
+        with self.assertRaises(TypeError):
+            DNAStrategy(genes=[0, 1], selection_strategy=BitFlipMutation())
+        with self.assertRaises(TypeError):
+            DNAStrategy(genes=[0, 1], surrogate_strategy="TournamentSelection")
+
+    def test_default_strategies_are_not_shared(self):
+        first, second = DNAStrategy(genes=[0, 1]), DNAStrategy(genes=[0, 1])
+        self.assertIsNot(first.selection.selection_strategy, second.selection.selection_strategy)
+        self.assertIsNot(first.crossover.crossover_strategy, second.crossover.crossover_strategy)
+        self.assertIsNot(first.mutation.mutation_strategy, second.mutation.mutation_strategy)
+        self.assertIsNot(first.fitness_function.fitness_strategy, second.fitness_function.fitness_strategy)
+        # Changing the mutation rate of one run must not affect the other
+        first.mutation.set_mutation_rate(0.5)
+        self.assertNotEqual(second.mutation.mutation_strategy.mutation_rate, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import random
+import unittest
+
+from genetic_algorithm_py import DNA, Population
+from genetic_algorithm_py.defaults import (
+    RouletteWheelSelection, StochasticUniversalSampling, TournamentSelection, TruncationSelection,
+)
+from genetic_algorithm_py.strategy import DNAStrategy
+
+
+class SelectionTest(unittest.TestCase):
+    def setUp(self):
+        random.seed(13)
+        self.population = Population(DNA(DNAStrategy(genes=[0, 1])), 10, 8)
+        for index, individual in enumerate(self.population.individuals):
+            individual.fitness = float(index + 1)
+
+    def test_parent_indices_shape_and_range(self):
+        strategies = [TournamentSelection(), StochasticUniversalSampling(), TruncationSelection(),
+                      RouletteWheelSelection()]
+        for strategy in strategies:
+            parent_indices = strategy.select_parent_indices(self.population, 7)
+            self.assertEqual(len(parent_indices), 7)
+            for pair in parent_indices:
+                self.assertEqual(len(pair), 2)
+                self.assertTrue(all(isinstance(index, int) and 0 <= index < 10 for index in pair))
+
+    def test_select_parents_returns_two_parents(self):
+        strategies = [TournamentSelection(), StochasticUniversalSampling(num_select=3), TruncationSelection()]
+        for strategy in strategies:
+            parents = strategy.select_parents(self.population)
+            self.assertEqual(len(parents), 2, type(strategy).__name__)
+            self.assertTrue(all(parent in self.population.individuals for parent in parents))
+
+    def test_sus_pointers_are_evenly_spaced(self):
+        # With equal fitness, one pointer per individual lands on every individual exactly once
+        for individual in self.population.individuals:
+            individual.fitness = 1.0
+        parent_indices = StochasticUniversalSampling().select_parent_indices(self.population, 5)
+        self.assertEqual(sorted(index for pair in parent_indices for index in pair), list(range(10)))
+        # Fitness 1..10 sums to 55, so 11 pointers are 5 apart and the fittest individual gets two
+        for individual, fitness in zip(self.population.individuals, range(1, 11)):
+            individual.fitness = float(fitness)
+        indices = StochasticUniversalSampling()._spin(self.population, 11)
+        self.assertEqual(indices.count(9), 2)
+        self.assertEqual(indices, sorted(indices))
+
+    def test_tournament_contestants_are_distinct(self):
+        # A tournament over the whole population always picks the fittest individual
+        parent_indices = TournamentSelection(tournament_size=10).select_parent_indices(self.population, 20)
+        self.assertEqual(set(index for pair in parent_indices for index in pair), {9})
+        with self.assertRaises(ValueError):
+            TournamentSelection(tournament_size=11).select_parent_indices(self.population, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
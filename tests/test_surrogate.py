@@ -0,0 +1,74 @@
+import contextlib
+import io
+import random
+import unittest
+
+from genetic_algorithm_py import DNA, GeneticAlgorithm, Individual, SurrogateFitnessFunction
+from genetic_algorithm_py.defaults import KNNSurrogate, MaximizeOnesFitness
+from genetic_algorithm_py.strategy import DNAStrategy
+
+
+class SurrogateFitnessTest(unittest.TestCase):
+    def setUp(self):
+        random.seed(5)
+
+    def make_dna(self, **surrogate_options):
+        surrogate_options.setdefault("min_samples", 20)
+        return DNA(DNAStrategy(genes=[0, 1], surrogate_strategy=KNNSurrogate(**surrogate_options)))
+
+    def test_invalid_sample_limits(self):
+        with self.assertRaises(ValueError):
+            KNNSurrogate(min_samples=0)
+        with self.assertRaises(ValueError):
+            KNNSurrogate(min_samples=50, max_samples=10)
+        with self.assertRaises(ValueError):
+            KNNSurrogate(audit_fraction=1.5)
+
+    def test_screening_saves_evaluations_and_flags_predictions(self):
+        dna = self.make_dna(audit_fraction=0.1)
+        fitness_function = dna.get_fitness_function()
+        self.assertIsInstance(fitness_function, SurrogateFitnessFunction)
+
+        # Until min_samples real evaluations exist, every genome is evaluated for real
+        warmup = [Individual(dna, 10) for _ in range(20)]
+        fitness_function.evaluate_individuals(warmup)
+        self.assertFalse(any(individual.fitness_is_predicted for individual in warmup))
+        self.assertEqual(fitness_function.saved_evaluations, 0)
+
+        # Then 10 promising and 3 audited genomes out of 40 are evaluated, the rest are predicted
+        individuals = [Individual(dna, 10) for _ in range(40)]
+        fitness_function.evaluate_individuals(individuals)
+        predicted = [individual for individual in individuals if individual.fitness_is_predicted]
+        self.assertEqual(len(predicted), 27)
+        self.assertEqual(fitness_function.saved_evaluations, 27)
+        self.assertEqual(fitness_function.evaluation_count, 20 + 13)
+        for individual in individuals:
+            if not individual.fitness_is_predicted:
+                self.assertEqual(individual.fitness, sum(individual.genome))
+
+        # Confirming a prediction evaluates it for real and no longer counts it as saved
+        fitness_function.confirm(predicted[0])
+        self.assertFalse(predicted[0].fitness_is_predicted)
+        self.assertEqual(predicted[0].fitness, sum(predicted[0].genome))
+        self.assertEqual(fitness_function.saved_evaluations, 26)
+
+    def test_best_individual_is_never_a_prediction(self):
+        ga = GeneticAlgorithm(self.make_dna(), population_size=40, genome_size=10, mutation_rate=0.1)
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(15):
+                best = ga.run_single_generation()
+                self.assertFalse(best.fitness_is_predicted)
+                self.assertEqual(best.fitness, MaximizeOnesFitness().evaluate(best.genome))
+        self.assertGreater(ga.dna.get_fitness_function().saved_evaluations, 0)
+
+    def test_ranking_accuracy_with_small_population(self):
+        ga = GeneticAlgorithm(self.make_dna(min_samples=3), population_size=3, genome_size=10, mutation_rate=0.1)
+        with contextlib.redirect_stdout(io.StringIO()):
+            ga.run(30)
+        accuracy = ga.dna.get_fitness_function().ranking_accuracy
+        self.assertIsNotNone(accuracy)
+        self.assertTrue(0 <= accuracy <= 1)
+
+
+if __name__ == "__main__":
+    unittest.main()